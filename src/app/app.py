@@ -3,6 +3,7 @@ from __future__ import annotations
 import dash
 import dash_bootstrap_components as dbc
 from dash import Dash, Input, Output, callback, dcc, html  # type: ignore
+from flask_compress import Compress
 
 from .logging_setup import get_logger, init_logging
 from .poincare.figure import build_poincare_figure
@@ -33,6 +34,17 @@ def create_app() -> Dash:
     )
     app.index_string = get_index_string()
 
+    # Compression des réponses: le layout des pages (texte pédagogique) et les
+    # figures sérialisées se compressent très bien
+    app.server.config["COMPRESS_MIMETYPES"] = [
+        "text/html",
+        "text/css",
+        "application/json",
+        "application/javascript",
+    ]
+    app.server.config["COMPRESS_LEVEL"] = 6
+    Compress(app.server)
+
     base_figure = build_poincare_figure()
 
     if dash.page_registry:
@@ -0,0 +1,163 @@
+/*
+ * Callbacks clientside de la page /stabilite.
+ *
+ * Les valeurs propres, le type d'équilibre et les équations d'un système 2×2
+ * se déduisent de (τ, Δ) en quelques opérations : inutile de faire un
+ * aller-retour serveur à chaque mouvement de slider. La logique reproduit
+ * format_eigenvalue_display(), classify_equilibrium() et tau_delta_to_matrix()
+ * (src/app/stabilite/eigenvalue_utils.py), qui restent la référence côté
+ * Python pour les pages statiques.
+ */
+(function () {
+  var TOL = 1e-10;
+
+  var NATURE_UNIFORME =
+    "Mouvement uniforme (valeurs propres nulles, pas de point d'équilibre, " +
+    "sauf si système statique, alors tous les points sont des points d'équilibre)";
+  var NATURE_REELLES = "Valeurs propres réelles";
+  var NATURE_COMPLEXES = "Valeurs propres complexes conjuguées";
+
+  /* λ = (τ ± √disc) / 2 avec disc = τ² − 4Δ, sous forme {re, im}. */
+  function eigenvalues(tau, disc) {
+    if (disc >= 0) {
+      var s = Math.sqrt(disc);
+      return [
+        { re: (tau + s) / 2, im: 0 },
+        { re: (tau - s) / 2, im: 0 },
+      ];
+    }
+    var w = Math.sqrt(-disc) / 2;
+    return [
+      { re: tau / 2, im: w },
+      { re: tau / 2, im: -w },
+    ];
+  }
+
+  function formatEigenvalues(tau, disc) {
+    var lambdas = eigenvalues(tau, disc);
+    var l1 = lambdas[0];
+    var l2 = lambdas[1];
+
+    var isUniform =
+      Math.abs(l1.re) < TOL &&
+      Math.abs(l1.im) < TOL &&
+      Math.abs(l2.re) < TOL &&
+      Math.abs(l2.im) < TOL;
+
+    if (isUniform) {
+      return { lambda1: "0", lambda2: "0", nature: NATURE_UNIFORME };
+    }
+    if (Math.abs(l1.im) < TOL) {
+      return {
+        lambda1: l1.re.toFixed(4),
+        lambda2: l2.re.toFixed(4),
+        nature: NATURE_REELLES,
+      };
+    }
+    var re = l1.re.toFixed(4);
+    var im = Math.abs(l1.im).toFixed(4);
+    return {
+      lambda1: re + " + " + im + "i",
+      lambda2: re + " - " + im + "i",
+      nature: NATURE_COMPLEXES,
+    };
+  }
+
+  /* Signe ternaire avec tolérance, comme _sign() côté Python. */
+  function sign(value) {
+    if (value > TOL) return 1;
+    if (value < -TOL) return -1;
+    return 0;
+  }
+
+  /* Mêmes règles (et même ordre de priorité) que _classify_signs(). */
+  function classify(tau, delta, disc) {
+    var sTau = sign(tau);
+    var sDelta = sign(delta);
+    var sDisc = sign(disc);
+    var stable = sTau < 0;
+
+    if (sTau === 0 && sDelta === 0) return "Mouvement uniforme";
+    if (sTau === 0 && sDelta > 0) return "Centre";
+    if (sDelta < 0) return "Point selle (instable)";
+    if (sDelta === 0) {
+      return stable
+        ? "Ligne de points d'équilibre (stable)"
+        : "Ligne de points d'équilibre (instable)";
+    }
+    if (sDisc === 0) return stable ? "Nœud dégénéré stable" : "Nœud dégénéré instable";
+    if (sDisc < 0) return stable ? "Foyer stable" : "Foyer instable";
+    return stable ? "Nœud stable" : "Nœud instable";
+  }
+
+  /* Matrice canonique de tau_delta_to_matrix() : [a, b, c, d]. */
+  function matrix(tau, delta) {
+    var a = tau / 2 + 0.1;
+    var d = tau / 2 - 0.1;
+    var b = 1.0;
+    return [a, b, (a * d - delta) / b, d];
+  }
+
+  /* Membre de droite « p x_1 + q x_2 », termes nuls omis. Le signe de q sert
+   * directement de séparateur, sans nettoyage de « + - » après coup. */
+  function rhs(p, q) {
+    var expr = Math.abs(p) > TOL ? p.toFixed(2) + " x_1" : "";
+    if (Math.abs(q) > TOL) {
+      var sep = q > 0 ? (expr ? " + " : "") : expr ? " - " : "- ";
+      expr += sep + Math.abs(q).toFixed(2) + " x_2";
+    }
+    return expr || "0";
+  }
+
+  /* Composant html.Div sérialisé, typographié ensuite par MathJax. */
+  function mathDiv(tex) {
+    return {
+      namespace: "dash_html_components",
+      type: "Div",
+      props: { children: "$$" + tex + "$$", className: "tex2jax_process" },
+    };
+  }
+
+  function formatOde(tau, delta) {
+    var m = matrix(tau, delta);
+    return {
+      namespace: "dash_html_components",
+      type: "Div",
+      props: {
+        children: [
+          mathDiv("\\dot{x}_1 = " + rhs(m[0], m[1])),
+          mathDiv("\\dot{x}_2 = " + rhs(m[2], m[3])),
+        ],
+      },
+    };
+  }
+
+  function isMissing(value) {
+    return value === null || value === undefined;
+  }
+
+  window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    stabilite: {
+      /* Type d'équilibre, EDO, valeurs propres et nature en un seul passage :
+       * le discriminant est calculé une fois pour les quatre affichages.
+       * La position en cours de glissement (drag_value) l'emporte sur la
+       * valeur validée, absente tant que le slider n'a pas été touché. */
+      updateDisplays: function (tau, delta, tauDrag, deltaDrag) {
+        if (!isMissing(tauDrag)) tau = tauDrag;
+        if (!isMissing(deltaDrag)) delta = deltaDrag;
+        if (isMissing(tau) || isMissing(delta)) {
+          var noUpdate = window.dash_clientside.no_update;
+          return [noUpdate, noUpdate, noUpdate, noUpdate];
+        }
+        var disc = tau * tau - 4 * delta;
+        var info = formatEigenvalues(tau, disc);
+        return [
+          classify(tau, delta, disc),
+          formatOde(tau, delta),
+          "λ₁ = " + info.lambda1 + ", λ₂ = " + info.lambda2,
+          info.nature,
+        ];
+      },
+    },
+  });
+})();
@@ -164,9 +164,7 @@ def register_callbacks(
             bool(clickData),
         )
         fig_any: Any = copy.deepcopy(base_figure)
-        try:
-            _ = fig_any.data[5]  # Vérifie la présence des zones
-        except Exception:
+        if len(fig_any.data) < 6:  # Vérifie la présence des zones
             log.warning("Figure inattendue: moins de 6 traces (coloration uniquement).")
             return fig_any
 
@@ -207,10 +205,7 @@ def register_callbacks(
                     trace.fillcolor = fill
                 line_obj = getattr(trace, "line", None)
                 if line_obj is not None and hasattr(line_obj, "width"):
-                    try:
-                        line_obj.width = 0
-                    except Exception:
-                        pass
+                    line_obj.width = 0
                 continue
 
             # 2) Lignes (parabole gauche/droite, axes x/y)
@@ -274,10 +269,9 @@ def register_callbacks(
             )
         pt = clickData["points"][0]
         curve = pt.get("curveNumber")
-        try:
+        meta = None
+        if isinstance(curve, int) and 0 <= curve < len(base_figure.data):
             meta = getattr(base_figure.data[curve], "meta", None)
-        except Exception:
-            meta = None
 
         layout_builder = LAYOUT_BY_META.get(str(meta))
         if layout_builder:
@@ -16,16 +16,13 @@ from __future__ import annotations
 from typing import Callable, Optional
 
 import plotly.graph_objects as go
-from dash import Dash, Input, Output, State, html, no_update
+from dash import Dash, Input, Output, html
 
 from src.app.style.palette import PALETTE
-from src.app.style.text import TEXT
 
-from .base_figures import create_phase_diagram, create_system_graph
+from .base_figures import create_phase_diagram, create_system_graph, static_figure_dict
 from .base_layout import stability_ids
-from .eigenvalue_utils import (calculate_eigenvalues, classify_equilibrium,
-                               format_eigenvalue_display,
-                               tau_delta_to_matrix_typed)
+from .eigenvalue_utils import format_eigenvalue_display, tau_delta_to_matrix_typed
 
 
 def register_stability_callbacks(
@@ -48,6 +45,11 @@ def register_stability_callbacks(
     """
     ids = stability_ids(page_key)
 
+    # (τ, Δ) sont fixes pour la page: valeurs propres, classification et
+    # coefficients sont calculés une seule fois et partagés par les callbacks
+    eigenvalue_info = format_eigenvalue_display(tau, delta)
+    a, b, c, d = tau_delta_to_matrix_typed(tau, delta, page_key)
+
     # Affichage statique des valeurs propres
     @app.callback(
         Output(ids["eigenvalue_display"], "children"),
@@ -56,29 +58,27 @@ def register_stability_callbacks(
     )
     def _display_eigenvalues(_eigenvalue_id: Optional[str]):
         """Affiche les valeurs propres pour ce type d'équilibre."""
-        eigenvalue_info = format_eigenvalue_display(tau, delta)
-
         return [
             html.Div(
                 [
                     html.Strong(
                         "Type de point d'équilibre : ", style={"color": PALETTE.primary}
                     ),
-                    html.Span(eigenvalue_info["type"]),
+                    html.Span(eigenvalue_info.eq_type),
                 ],
                 style={"marginBottom": "1rem"},
             ),
             html.Div(
                 [
                     html.Strong("Valeurs propres : "),
-                    html.Span(eigenvalue_info["eigenvalues"]),
+                    html.Span(eigenvalue_info.eigenvalues),
                 ],
                 style={"marginBottom": "0.5rem"},
             ),
             html.Div(
                 [
                     html.Strong("Nature : "),
-                    html.Span(eigenvalue_info["nature"]),
+                    html.Span(eigenvalue_info.nature),
                 ]
             ),
         ]
@@ -91,7 +91,6 @@ def register_stability_callbacks(
     )
     def _display_ode(_ode_id: Optional[str]):
         """Affiche l'équation différentielle du système."""
-        a, b, c, d = tau_delta_to_matrix_typed(tau, delta, page_key)
 
         # Formater les coefficients pour l'affichage
         def format_coeff(val: float) -> str:
@@ -171,16 +170,14 @@ def register_stability_callbacks(
         Input(ids["phase"], "id"),
         prevent_initial_call=False,
     )
-    def _display_phase_diagram(_phase_id: Optional[str]) -> go.Figure:
+    def _display_phase_diagram(_phase_id: Optional[str]) -> go.Figure | dict:
         """Affiche le diagramme de phase pour ce type d'équilibre."""
         # Si une fonction personnalisée est fournie, l'utiliser
         if create_phase_fig is not None:
-            return create_phase_fig()
+            return static_figure_dict(create_phase_fig)
 
         # Sinon, utiliser la conversion typée basée sur page_key
-        a, b, c, d = tau_delta_to_matrix_typed(tau, delta, page_key)
-        eq_type = classify_equilibrium(tau, delta)
-        title = f"Diagramme de phase: {eq_type}"
+        title = f"Diagramme de phase: {eigenvalue_info.eq_type}"
 
         # Créer le diagramme avec les paramètres calculés
         return create_phase_diagram(a, b, c, d, title=title)
@@ -193,10 +190,7 @@ def register_stability_callbacks(
     )
     def _display_system_graph(_system_graph_id: Optional[str]) -> go.Figure:
         """Affiche le graphe temporel x₁(t) et x₂(t) pour ce type d'équilibre."""
-        # Obtenir les coefficients de la matrice
-        a, b, c, d = tau_delta_to_matrix_typed(tau, delta, page_key)
-        eq_type = classify_equilibrium(tau, delta)
-        title = f"Évolution temporelle: {eq_type}"
+        title = f"Évolution temporelle: {eigenvalue_info.eq_type}"
 
         # Créer le graphe avec les paramètres calculés
         return create_system_graph(a, b, c, d, title=title)
@@ -2,7 +2,7 @@
 Phase diagram generation for stability analysis visualizations.
 
 This module creates interactive phase portraits showing:
-1. System trajectories (solved ODEs)
+1. System trajectories (exact solution of the linear ODE)
 2. Vector field (direction field with arrows)
 3. Equilibrium points
 4. Separatrices (for saddles)
@@ -17,12 +17,14 @@ System format:
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import Iterable, Optional, Tuple
+import math
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 
 import numpy as np
 import plotly.graph_objects as go
-from scipy.integrate import odeint
 
 from src.app.style.palette import PALETTE
 
@@ -92,6 +94,183 @@ def phase_with_equilibria(
     return fig
 
 
+def _linear_flow(
+    a: float, b: float, c: float, d: float, t: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Coefficients (f₀, f₁) de la solution exacte: exp(A·t) = f₀(t)·I + f₁(t)·A.
+
+    Avec μ = τ/2 et N = A - μI, on a N² = (τ²/4 - Δ)·I (Cayley-Hamilton), d'où
+    exp(A·t) = e^{μt}·[C(t)·I + S(t)·N] avec, selon le signe de q = τ²/4 - Δ:
+    - q > 0: C = cosh(√q·t), S = sinh(√q·t)/√q
+    - q < 0: C = cos(√-q·t), S = sin(√-q·t)/√-q
+    - q = 0: C = 1, S = t (bloc de Jordan, cas dégénéré)
+
+    Aucune intégration numérique: la solution s'évalue d'un bloc sur tout t.
+    """
+    mu = 0.5 * (a + d)
+    q = mu * mu - (a * d - b * c)
+
+    if q > 0:
+        root = math.sqrt(q)
+        cos_part = np.cosh(root * t)
+        sin_part = np.sinh(root * t) / root
+    elif q < 0:
+        root = math.sqrt(-q)
+        cos_part = np.cos(root * t)
+        sin_part = np.sin(root * t) / root
+    else:
+        cos_part = np.ones_like(t)
+        sin_part = t
+
+    growth = np.exp(mu * t)
+    return growth * (cos_part - mu * sin_part), growth * sin_part
+
+
+def _linear_trajectory(
+    a: float,
+    b: float,
+    c: float,
+    d: float,
+    x0: float,
+    y0: float,
+    t: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Trajectoire exacte (x₁(t), x₂(t)) issue de (x0, y0): exp(A·t)·(x0, y0).
+
+    x0 et y0 peuvent être des colonnes (N, 1): les N trajectoires sont alors
+    évaluées d'un seul bloc et renvoyées sous forme de tableaux (N, len(t)).
+    """
+    f0, f1 = _linear_flow(a, b, c, d, t)
+    return f0 * x0 + f1 * (a * x0 + b * y0), f0 * y0 + f1 * (c * x0 + d * y0)
+
+
+def figure_to_plain_dict(fig: go.Figure) -> Dict[str, Any]:
+    """
+    Serialize a figure once into a JSON-ready dict (typed arrays encoded as
+    base64).
+
+    Dash re-encodes a go.Figure (NumPy arrays included) on every response;
+    returning this dict instead skips that work. Meant for cached figures.
+    """
+    return json.loads(fig.to_json())
+
+
+def _build_seed_grid() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Conditions initiales des trajectoires du portrait de phase.
+
+    Grille régulière de pas 1.2 sur [-3, 3]², sans les points proches de
+    l'origine; renvoyées en colonnes (N, 1) pour _linear_trajectory.
+    """
+    seed_axis = np.arange(-3, 3.5, 1.2)
+    x0_grid, y0_grid = np.meshgrid(seed_axis, seed_axis, indexing="ij")
+    keep = (np.abs(x0_grid) > 0.3) | (np.abs(y0_grid) > 0.3)  # Éviter l'origine
+    x0_seeds = x0_grid[keep][:, np.newaxis]
+    y0_seeds = y0_grid[keep][:, np.newaxis]
+    x0_seeds.setflags(write=False)
+    y0_seeds.setflags(write=False)
+    return x0_seeds, y0_seeds
+
+
+# Identiques pour toutes les figures: construites une fois, en lecture seule
+_SEED_X0, _SEED_Y0 = _build_seed_grid()
+
+
+@lru_cache(maxsize=None)
+def _arrow_grid(
+    x_min: float, x_max: float, y_min: float, y_max: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Points d'ancrage des vecteurs vitesse (grille 12×12) sur la fenêtre donnée.
+
+    Seules deux fenêtres existent (standard et mouvement uniforme): chaque
+    grille est construite une fois puis partagée, en lecture seule.
+    """
+    x_arrow = np.linspace(x_min, x_max, 12)
+    y_arrow = np.linspace(y_min, y_max, 12)
+    x_grid, y_grid = np.meshgrid(x_arrow, y_arrow, indexing="ij")
+    x_grid.setflags(write=False)
+    y_grid.setflags(write=False)
+    return x_grid, y_grid
+
+
+@lru_cache(maxsize=None)
+def static_figure_dict(create_fig: Callable[[], go.Figure]) -> Dict[str, Any]:
+    """
+    Plain-dict version of a constant figure, serialized once per builder.
+
+    The dict is shared between calls: callers must not mutate it.
+    """
+    return figure_to_plain_dict(create_fig())
+
+
+@lru_cache(maxsize=32)
+def _phase_diagram_layout(
+    title: str, x_min: float, x_max: float, y_min: float, y_max: float
+) -> go.Layout:
+    """
+    Layout du portrait de phase, qui ne dépend que du titre et de la fenêtre.
+
+    Construit (thème compris) une fois par combinaison puis copié par
+    go.Figure(layout=...): chaque figure ne paie plus que ses traces.
+    """
+    fig = go.Figure()
+    fig.update_layout(
+        title=title,
+        xaxis_title="x₁",
+        yaxis_title="x₂",
+        hovermode="closest",
+        width=None,
+        height=500,
+        xaxis=dict(
+            range=[x_min, x_max],
+            scaleanchor="y",
+            scaleratio=1,
+            gridcolor=PALETTE.plot_bg,
+        ),
+        yaxis=dict(
+            range=[y_min, y_max],
+            scaleanchor="x",
+            scaleratio=1,
+            gridcolor=PALETTE.plot_bg,
+        ),
+        template="plotly_white",
+        showlegend=False,  # Désactiver la légende Plotly (sera dans le HTML)
+        margin=dict(l=60, r=60, t=60, b=60),
+    )
+    return fig.layout
+
+
+@lru_cache(maxsize=32)
+def _system_graph_layout(title: str) -> go.Layout:
+    """Layout du graphe temporel, construit une fois par titre (voir ci-dessus)."""
+    fig = go.Figure()
+    fig.update_layout(
+        title=title,
+        xaxis_title="Temps (t)",
+        yaxis_title="Valeur",
+        hovermode="x unified",
+        width=None,
+        height=500,
+        template="plotly_white",
+        xaxis=dict(gridcolor=PALETTE.plot_bg),
+        yaxis=dict(gridcolor=PALETTE.plot_bg),
+        legend=dict(
+            x=0.02,
+            y=0.98,
+            xanchor="left",
+            yanchor="top",
+            bgcolor=PALETTE.bg,
+            bordercolor=PALETTE.border,
+            borderwidth=1,
+        ),
+        margin=dict(l=60, r=60, t=60, b=60),
+    )
+    return fig.layout
+
+
 def _build_phase_diagram_figure(
     a: float,
     b: float,
@@ -120,14 +299,12 @@ def _build_phase_diagram_figure(
     Returns:
         Plotly figure with complete phase portrait
     """
-    fig = go.Figure()
-
     # === ÉTAPE 1: Calculer trace et déterminant ===
     trace = a + d
     det = a * d - b * c
 
     # === ÉTAPE 2: Prédire la nature de l'équilibre ===
-    discriminant = trace**2 - 4 * det
+    discriminant = trace * trace - 4 * det
     is_centre = abs(trace) < 1e-10 and det > 0
     is_mouvement_uniforme = abs(trace) < 1e-10 and abs(det) < 1e-10
     is_selle = det < 0
@@ -140,13 +317,14 @@ def _build_phase_diagram_figure(
         eigenvalues_real = True
     elif discriminant > 0:
         # Valeurs propres réelles distinctes
-        lambda1 = (trace + np.sqrt(discriminant)) / 2
-        lambda2 = (trace - np.sqrt(discriminant)) / 2
+        sqrt_disc = math.sqrt(discriminant)
+        lambda1 = (trace + sqrt_disc) / 2
+        lambda2 = (trace - sqrt_disc) / 2
         eigenvalues_real = True
     else:
         # Valeurs propres complexes conjuguées
         real_part = trace / 2
-        imag_part = np.sqrt(-discriminant) / 2
+        imag_part = math.sqrt(-discriminant) / 2
         lambda1 = complex(real_part, imag_part)
         lambda2 = complex(real_part, -imag_part)
         eigenvalues_real = False
@@ -160,6 +338,8 @@ def _build_phase_diagram_figure(
         x_range = [-standard_range, standard_range]
         y_range = [-standard_range, standard_range]
 
+    fig = go.Figure(layout=_phase_diagram_layout(title, *x_range, *y_range))
+
     # === ÉTAPE 4: Vecteurs propres et droites invariantes ===
     if eigenvalues_real and not is_mouvement_uniforme:
         # Calculer les vecteurs propres pour valeurs propres réelles
@@ -197,7 +377,7 @@ def _build_phase_diagram_figure(
 
                 if np.any(mask):
                     fig.add_trace(
-                        go.Scatter(
+                        go.Scattergl(
                             x=x_line[mask],
                             y=y_line[mask],
                             mode="lines",
@@ -221,7 +401,7 @@ def _build_phase_diagram_figure(
         mask1 = (y_iso1 >= y_range[0]) & (y_iso1 <= y_range[1])
         if np.any(mask1):
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=x_iso1[mask1],
                     y=y_iso1[mask1],
                     mode="lines",
@@ -238,7 +418,7 @@ def _build_phase_diagram_figure(
         mask2 = (y_iso2 >= y_range[0]) & (y_iso2 <= y_range[1])
         if np.any(mask2):
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=x_iso2[mask2],
                     y=y_iso2[mask2],
                     mode="lines",
@@ -250,74 +430,54 @@ def _build_phase_diagram_figure(
             )
 
     # === ÉTAPE 7: Dessiner des vecteurs vitesse ===
-    grid_density = 12
-    x_arrow = np.linspace(x_range[0], x_range[1], grid_density)
-    y_arrow = np.linspace(y_range[0], y_range[1], grid_density)
-
-    for x_pos in x_arrow:
-        for y_pos in y_arrow:
-            dx = a * x_pos + b * y_pos
-            dy = c * x_pos + d * y_pos
-            norm = np.sqrt(dx**2 + dy**2)
-
-            if norm > 0.05:
-                # Normaliser et mettre à l'échelle
-                scale = 0.25
-                dx_scaled = (dx / norm) * scale
-                dy_scaled = (dy / norm) * scale
-
-                arrow_color = PALETTE.secondary
-
-                fig.add_trace(
-                    go.Scatter(
-                        x=[x_pos, x_pos + dx_scaled],
-                        y=[y_pos, y_pos + dy_scaled],
-                        mode="lines",
-                        line=dict(color=arrow_color, width=1.5),
-                        hoverinfo="skip",
-                        showlegend=False,
-                    )
-                )
+    x_grid, y_grid = _arrow_grid(*x_range, *y_range)
+
+    # Champ de vitesse sur toute la grille, en une seule opération
+    dx = a * x_grid + b * y_grid
+    dy = c * x_grid + d * y_grid
+    norm = np.hypot(dx, dy)
+
+    # Ignorer les vitesses quasi nulles
+    visible = norm > 0.05
+    x_pos, y_pos = x_grid[visible], y_grid[visible]
+    dx, dy, norm = dx[visible], dy[visible], norm[visible]
+
+    # Normaliser et mettre à l'échelle
+    scale = 0.25
+    x_tip = x_pos + (dx / norm) * scale
+    y_tip = y_pos + (dy / norm) * scale
+
+    # Petites têtes de flèche
+    angle = np.arctan2(dy, dx)
+    head_len = 0.08
+    head_ang = np.pi / 6
+    x_head1 = x_tip - head_len * np.cos(angle - head_ang)
+    y_head1 = y_tip - head_len * np.sin(angle - head_ang)
+    x_head2 = x_tip - head_len * np.cos(angle + head_ang)
+    y_head2 = y_tip - head_len * np.sin(angle + head_ang)
+
+    # Une seule trace: tige puis deux branches de tête par flèche, segments
+    # séparés par NaN (Plotly coupe la ligne sur les valeurs manquantes)
+    gap = np.full_like(x_pos, np.nan)
+    arrows_x = np.column_stack(
+        [x_pos, x_tip, gap, x_tip, x_head1, gap, x_tip, x_head2, gap]
+    ).ravel()
+    arrows_y = np.column_stack(
+        [y_pos, y_tip, gap, y_tip, y_head1, gap, y_tip, y_head2, gap]
+    ).ravel()
 
-                # Ajouter une petite tête de flèche
-                angle = np.arctan2(dy, dx)
-                head_len = 0.08
-                head_ang = np.pi / 6
-
-                x_tip = x_pos + dx_scaled
-                y_tip = y_pos + dy_scaled
-
-                x_head1 = x_tip - head_len * np.cos(angle - head_ang)
-                y_head1 = y_tip - head_len * np.sin(angle - head_ang)
-                x_head2 = x_tip - head_len * np.cos(angle + head_ang)
-                y_head2 = y_tip - head_len * np.sin(angle + head_ang)
-
-                fig.add_trace(
-                    go.Scatter(
-                        x=[x_tip, x_head1],
-                        y=[y_tip, y_head1],
-                        mode="lines",
-                        line=dict(color=arrow_color, width=1.5),
-                        hoverinfo="skip",
-                        showlegend=False,
-                    )
-                )
-                fig.add_trace(
-                    go.Scatter(
-                        x=[x_tip, x_head2],
-                        y=[y_tip, y_head2],
-                        mode="lines",
-                        line=dict(color=arrow_color, width=1.5),
-                        hoverinfo="skip",
-                        showlegend=False,
-                    )
-                )
+    fig.add_trace(
+        go.Scattergl(
+            x=arrows_x,
+            y=arrows_y,
+            mode="lines",
+            line=dict(color=PALETTE.secondary, width=1.5),
+            hoverinfo="skip",
+            showlegend=False,
+        )
+    )
 
     # === ÉTAPE 8: Tracer les trajectoires ===
-    def system(state, t):
-        x1_var, x2_var = state
-        return [a * x1_var + b * x2_var, c * x1_var + d * x2_var]
-
     # Adapter le temps d'intégration selon le type
     if is_mouvement_uniforme:
         t_span = np.linspace(0, 4, 40)
@@ -330,45 +490,37 @@ def _build_phase_diagram_figure(
     else:
         t_span = np.linspace(0, 8, 50)
 
-    # Conditions initiales bien choisies
-    initial_conditions = []
-    for x0 in np.arange(-3, 3.5, 1.2):
-        for y0 in np.arange(-3, 3.5, 1.2):
-            if abs(x0) > 0.3 or abs(y0) > 0.3:  # Éviter l'origine
-                initial_conditions.append((x0, y0))
+    # Toutes les trajectoires d'un bloc: tableaux (nb conditions, len(t_span))
+    x_trajs, y_trajs = _linear_trajectory(a, b, c, d, _SEED_X0, _SEED_Y0, t_span)
 
-    # Tracer les trajectoires
-    for x0, y0 in initial_conditions:
-        try:
-            traj = odeint(system, [x0, y0], t_span, full_output=False)
-            x_traj = traj[:, 0]
-            y_traj = traj[:, 1]
-
-            # Filtrer les points dans les limites
-            mask = (
-                (x_traj >= x_range[0] - 1)
-                & (x_traj <= x_range[1] + 1)
-                & (y_traj >= y_range[0] - 1)
-                & (y_traj <= y_range[1] + 1)
-            )
+    # Filtrer les points dans les limites
+    masks = (
+        (x_trajs >= x_range[0] - 1)
+        & (x_trajs <= x_range[1] + 1)
+        & (y_trajs >= y_range[0] - 1)
+        & (y_trajs <= y_range[1] + 1)
+    )
 
-            if np.any(mask):
-                fig.add_trace(
-                    go.Scatter(
-                        x=x_traj[mask],
-                        y=y_traj[mask],
-                        mode="lines",
-                        line=dict(color=PALETTE.primary, width=1),
-                        hoverinfo="skip",
-                        showlegend=False,
-                    )
+    # Tracer les trajectoires
+    for x_traj, y_traj, mask in zip(x_trajs, y_trajs, masks):
+        if mask.any():
+            fig.add_trace(
+                go.Scattergl(
+                    x=x_traj[mask],
+                    y=y_traj[mask],
+                    mode="lines",
+                    line=dict(color=PALETTE.primary, width=1),
+                    hoverinfo="skip",
+                    showlegend=False,
                 )
-        except:
-            pass
+            )
 
     # === Ajouter le point d'équilibre ===
+    # Le canvas WebGL est peint au-dessus des traces SVG: le marqueur est donc
+    # lui aussi en WebGL, ajouté en dernier pour passer sur les lignes qui
+    # traversent l'origine (droites propres, isoclines, trajectoires)
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=[0],
             y=[0],
             mode="markers",
@@ -380,31 +532,6 @@ def _build_phase_diagram_figure(
         )
     )
 
-    # === Configuration finale ===
-    fig.update_layout(
-        title=title,
-        xaxis_title="x₁",
-        yaxis_title="x₂",
-        hovermode="closest",
-        width=None,
-        height=500,
-        xaxis=dict(
-            range=x_range,
-            scaleanchor="y",
-            scaleratio=1,
-            gridcolor=PALETTE.plot_bg,
-        ),
-        yaxis=dict(
-            range=y_range,
-            scaleanchor="x",
-            scaleratio=1,
-            gridcolor=PALETTE.plot_bg,
-        ),
-        template="plotly_white",
-        showlegend=False,  # Désactiver la légende Plotly (sera dans le HTML)
-        margin=dict(l=60, r=60, t=60, b=60),
-    )
-
     return fig
 
 
@@ -449,12 +576,7 @@ def create_system_graph(
     Returns:
         Figure Plotly avec x₁(t) et x₂(t)
     """
-    fig = go.Figure()
-
-    # Définir le système
-    def system(state, t):
-        x1_var, x2_var = state
-        return [a * x1_var + b * x2_var, c * x1_var + d * x2_var]
+    fig = go.Figure(layout=_system_graph_layout(title))
 
     # Détecter le type de système pour adapter le temps d'intégration
     trace = a + d
@@ -477,15 +599,8 @@ def create_system_graph(
     else:
         t = np.linspace(0, 16, 400)
 
-    # Résoudre le système
-    try:
-        trajectory = odeint(system, list(initial_condition), t, full_output=False)
-        x1_vals = trajectory[:, 0]
-        x2_vals = trajectory[:, 1]
-    except:
-        # Retourner un placeholder en cas d'erreur
-        fig.update_layout(title=title, template="plotly_white")
-        return fig
+    # Solution exacte du système linéaire
+    x1_vals, x2_vals = _linear_trajectory(a, b, c, d, *initial_condition, t)
 
     # Ajouter les courbes x₁(t) et x₂(t)
     fig.add_trace(
@@ -508,27 +623,4 @@ def create_system_graph(
         )
     )
 
-    # Configuration du layout
-    fig.update_layout(
-        title=title,
-        xaxis_title="Temps (t)",
-        yaxis_title="Valeur",
-        hovermode="x unified",
-        width=None,
-        height=500,
-        template="plotly_white",
-        xaxis=dict(gridcolor=PALETTE.plot_bg),
-        yaxis=dict(gridcolor=PALETTE.plot_bg),
-        legend=dict(
-            x=0.02,
-            y=0.98,
-            xanchor="left",
-            yanchor="top",
-            bgcolor=PALETTE.bg,
-            bordercolor=PALETTE.border,
-            borderwidth=1,
-        ),
-        margin=dict(l=60, r=60, t=60, b=60),
-    )
-
     return fig
@@ -18,7 +18,7 @@ from __future__ import annotations
 from typing import Callable, Dict, Optional
 
 import plotly.graph_objects as go
-from dash import Input, Output, callback, dcc, html
+from dash import dcc, html
 
 from src.app.style.components.layout import (code_display, content_wrapper,
                                              graph_container, section_card,
@@ -27,7 +27,6 @@ from src.app.style.components.layout import (code_display, content_wrapper,
                                              spacing_section)
 from src.app.style.palette import PALETTE
 from src.app.style.text import TEXT
-from src.app.style.typography import TYPOGRAPHY
 
 
 def _slugify(page_key: str) -> str:
@@ -72,13 +71,20 @@ def build_stability_layout(
 
     Args:
         page_key: Unique identifier for the page
-        layout_pedagogic_fn: Function returning pedagogical content
+        layout_pedagogic_fn: Function returning pedagogical content. Page modules
+            return one module-level tree on every call; it is never mutated
         tau: Trace value for this equilibrium type
         delta: Determinant value for this equilibrium type
-        create_phase_fig: Optional function that returns the phase diagram figure
+        create_phase_fig: Optional function that returns the phase diagram figure.
+            Its result is serialized once and shared (see static_figure_dict), so
+            it must be a constant figure; page modules memoize it with lru_cache
     """
     # Import here to avoid circular dependencies
-    from .base_figures import create_phase_diagram, create_system_graph
+    from .base_figures import (
+        create_phase_diagram,
+        create_system_graph,
+        static_figure_dict,
+    )
     from .eigenvalue_utils import (classify_equilibrium,
                                    format_eigenvalue_display,
                                    tau_delta_to_matrix_typed)
@@ -99,21 +105,21 @@ def build_stability_layout(
                     html.Strong(
                         "Type de point d'équilibre : ", style={"color": PALETTE.primary}
                     ),
-                    html.Span(eigenvalue_info["type"]),
+                    html.Span(eigenvalue_info.eq_type),
                 ],
                 style={"marginBottom": "1rem"},
             ),
             html.Div(
                 [
                     html.Strong("Valeurs propres : "),
-                    html.Span(eigenvalue_info["eigenvalues"]),
+                    html.Span(eigenvalue_info.eigenvalues),
                 ],
                 style={"marginBottom": "0.5rem"},
             ),
             html.Div(
                 [
                     html.Strong("Nature : "),
-                    html.Span(eigenvalue_info["nature"]),
+                    html.Span(eigenvalue_info.nature),
                 ]
             ),
         ]
@@ -169,7 +175,7 @@ def build_stability_layout(
 
     # Generate phase diagram
     if create_phase_fig is not None:
-        phase_fig = create_phase_fig()
+        phase_fig = static_figure_dict(create_phase_fig)
     else:
         eq_type = classify_equilibrium(tau, delta)
         phase_fig = create_phase_diagram(
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import plotly.graph_objects as go
 from dash import html
 
 from src.app.stabilite.base_callbacks import register_stability_callbacks
 from src.app.stabilite.base_figures import create_phase_diagram
-from src.app.stabilite.base_layout import build_stability_layout, stability_ids
+from src.app.stabilite.base_layout import stability_ids
 
 # Clé de page pour "Centre"
 PAGE_KEY = "centre"
@@ -28,6 +30,7 @@ def get_ids() -> dict[str, str]:
     return stability_ids(PAGE_KEY)
 
 
+@lru_cache(maxsize=1)
 def create_figure() -> go.Figure:
     """
     Crée le diagramme de phase pour un centre.
@@ -54,38 +57,41 @@ def get_constraints() -> dict:
     }
 
 
+_LAYOUT_PEDAGOGIC = html.Div(
+    [
+        html.P(
+            "Un point d’équilibre est un centre lorsque les valeurs propres sont purement imaginaires. Les trajectoires sont alors des courbes fermées (cercles ou ellipses), traduisant un mouvement oscillatoire sans amortissement. L’équilibre est donc stable mais non asymptotiquement stable, car les trajectoires ne convergent pas vers le point d’équilibre."
+        ),
+        html.H4("Exemple de la vie réelle :"),
+        html.Ul(
+            [
+                html.Li(
+                    "Un pendule dans le vide: Sans friction, un pendule oscille indéfiniment autour du point d'équilibre, ni divergent ni convergent."
+                ),
+                html.Li(
+                    "La Lune orbitant autour de la Terre: La Lune suit une trajectoire fermée et stable autour de la Terre, illustrant un mouvement continu en orbite."
+                ),
+            ]
+        ),
+        html.H4("Caractéristiques mathématiques:"),
+        html.Ul(
+            [
+                html.Li("$\\tau$ = 0"),
+                html.Li("$\\Delta$ > 0"),
+                html.Li("Racines complexes pures"),
+                html.Li("Partie réelle nulle"),
+                html.Li("Comportement: oscillations perpétuelles"),
+            ]
+        ),
+    ]
+)
+
+
 def layout_pedagogic() -> html.Div:
     """
     Retourne le contenu pédagogique pour la page Centre.
     """
-    return html.Div(
-        [
-            html.P(
-                "Un point d’équilibre est un centre lorsque les valeurs propres sont purement imaginaires. Les trajectoires sont alors des courbes fermées (cercles ou ellipses), traduisant un mouvement oscillatoire sans amortissement. L’équilibre est donc stable mais non asymptotiquement stable, car les trajectoires ne convergent pas vers le point d’équilibre."
-            ),
-            html.H4("Exemple de la vie réelle :"),
-            html.Ul(
-                [
-                    html.Li(
-                        "Un pendule dans le vide: Sans friction, un pendule oscille indéfiniment autour du point d'équilibre, ni divergent ni convergent."
-                    ),
-                    html.Li(
-                        "La Lune orbitant autour de la Terre: La Lune suit une trajectoire fermée et stable autour de la Terre, illustrant un mouvement continu en orbite."
-                    ),
-                ]
-            ),
-            html.H4("Caractéristiques mathématiques:"),
-            html.Ul(
-                [
-                    html.Li("$\\tau$ = 0"),
-                    html.Li("$\\Delta$ > 0"),
-                    html.Li("Racines complexes pures"),
-                    html.Li("Partie réelle nulle"),
-                    html.Li("Comportement: oscillations perpétuelles"),
-                ]
-            ),
-        ]
-    )
+    return _LAYOUT_PEDAGOGIC
 
 
 def register_callbacks(app) -> None:
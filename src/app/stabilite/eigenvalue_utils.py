@@ -22,13 +22,28 @@ Different regions correspond to different equilibrium types:
 
 from __future__ import annotations
 
-from typing import Dict, Tuple
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from typing import Callable, Dict, Tuple
 
-import numpy as np
 import plotly.graph_objects as go
 
 from src.app.style.palette import PALETTE
-from src.app.style.plot.theme import FIGURE_THEME, apply_to_figure
+from src.app.style.plot.theme import apply_to_figure
+
+# Memoization of the pure (τ, Δ) → result functions. Dash callbacks fire on
+# every slider tick and the same pairs recur constantly (defaults, 0.1 steps).
+_CACHE_SIZE = 2048
+# Keys are rounded well below the classification tolerance (1e-10) so that
+# float noise such as 0.30000000000000004 maps to the same entry as 0.3.
+_CACHE_KEY_DECIMALS = 12
+
+
+def _cache_key(value: float) -> float:
+    """Snap a float onto a fine grid to stabilize memoization keys."""
+    return round(float(value), _CACHE_KEY_DECIMALS)
 
 
 def tau_delta_to_matrix(tau: float, delta: float) -> Tuple[float, float, float, float]:
@@ -73,6 +88,101 @@ def tau_delta_to_matrix(tau: float, delta: float) -> Tuple[float, float, float,
     return a, b, c, d
 
 
+def _foyer_matrix(tau: float, delta: float) -> Tuple[float, float, float, float]:
+    """Foyers (stable/instable): structure spirale."""
+    # Structure: [ -α   β ]
+    #            [ -β  -α ]
+    # τ = -2α, Δ = α² + β²
+    alpha = -tau / 2
+    beta_squared = delta - alpha * alpha
+    beta = math.sqrt(beta_squared) if beta_squared > 0 else 0.5
+    return (-alpha, beta, -beta, -alpha)
+
+
+def _noeud_matrix(tau: float, delta: float) -> Tuple[float, float, float, float]:
+    """Nœuds (stable/instable): structure quasi-diagonale."""
+    # [ λ1   ε ]
+    # [  0  λ2 ]
+    lambda1_re, _, lambda2_re, _ = calculate_eigenvalue_parts(tau, delta)
+    return (lambda1_re, 0.1, 0, lambda2_re)
+
+
+def _noeud_degenere_matrix(
+    tau: float, delta: float
+) -> Tuple[float, float, float, float]:
+    """Nœuds dégénérés: structure diagonale."""
+    # [ λ1   0  ]
+    # [  0  λ2 ]
+    lambda1_re, _, lambda2_re, _ = calculate_eigenvalue_parts(tau, delta)
+    return (lambda1_re, 0, 0, lambda2_re)
+
+
+def _centre_matrix(tau: float, delta: float) -> Tuple[float, float, float, float]:
+    """Centre: structure antisymétrique."""
+    # Structure: [  0   β ]
+    #            [ -β   0 ]
+    # τ = 0, Δ = β²
+    beta = math.sqrt(delta) if delta > 0 else 1.0
+    return (0, beta, -beta, 0)
+
+
+def _selle_matrix(tau: float, delta: float) -> Tuple[float, float, float, float]:
+    """Selle: une valeur propre positive, une négative."""
+    # Structure: [ λ1   0 ]  where λ1 > 0, λ2 < 0
+    #            [  0  λ2 ]
+    lambda1_re, _, lambda2_re, _ = calculate_eigenvalue_parts(tau, delta)
+    return (lambda1_re, 0.5, 0.5, lambda2_re)
+
+
+def _mouvement_uniforme_matrix(
+    tau: float, delta: float
+) -> Tuple[float, float, float, float]:
+    """Mouvement uniforme: structure où une variable ne varie pas."""
+    # Structure: [  0   1 ]  (ou similaire)
+    #            [  0   0 ]
+    # Représente: dx₁/dt = x₂, dx₂/dt = 0
+    # Une valeur propre nulle (pas d'accélération)
+    return (0, 1, 0, 0)
+
+
+def _ligne_matrix(tau: float, delta: float) -> Tuple[float, float, float, float]:
+    """Ligne de points d'équilibre: une valeur propre nulle, une non-nulle."""
+    # [ λ   0 ]
+    # [ 0   0 ]
+    lambda_val = tau  # La seule valeur propre non-nulle
+    return (lambda_val, 0.1, 0, 0)
+
+
+@lru_cache(maxsize=64)
+def _matrix_builder(
+    equilibrium_type: str,
+) -> Callable[[float, float], Tuple[float, float, float, float]]:
+    """
+    Resolve the matrix builder for an equilibrium type (page key or label).
+
+    The substring rules run once per distinct string; later calls are a
+    cache hit, so tau_delta_to_matrix_typed dispatches in O(1).
+    """
+    eq_type = equilibrium_type.lower()
+
+    if "foyer" in eq_type:
+        return _foyer_matrix
+    if "noeud" in eq_type or "n\u0153ud" in eq_type:
+        if "degenere" in eq_type or "d\u00e9g\u00e9n\u00e9r\u00e9" in eq_type:
+            return _noeud_degenere_matrix
+        return _noeud_matrix
+    if "centre" in eq_type:
+        return _centre_matrix
+    if "selle" in eq_type:
+        return _selle_matrix
+    if "mouvement" in eq_type or "uniforme" in eq_type:
+        return _mouvement_uniforme_matrix
+    if "ligne" in eq_type:
+        return _ligne_matrix
+    # Par défaut: utiliser la méthode générique
+    return tau_delta_to_matrix
+
+
 def tau_delta_to_matrix_typed(
     tau: float, delta: float, equilibrium_type: str
 ) -> Tuple[float, float, float, float]:
@@ -87,66 +197,45 @@ def tau_delta_to_matrix_typed(
     Returns:
         Tuple (a, b, c, d) representing the matrix coefficients
     """
-    eq_type = equilibrium_type.lower()
+    return _matrix_builder(equilibrium_type)(tau, delta)
 
-    # Foyers (stable/instable): structure spirale
-    if "foyer" in eq_type:
-        # Structure: [ -α   β ]
-        #            [ -β  -α ]
-        # τ = -2α, Δ = α² + β²
-        alpha = -tau / 2
-        beta_squared = delta - alpha**2
-        beta = beta_squared**0.5 if beta_squared > 0 else 0.5
-        return (-alpha, beta, -beta, -alpha)
-
-    # Nœuds (stable/instable/dégénéré): structure diagonale ou quasi-diagonale
-    elif "noeud" in eq_type or "n\u0153ud" in eq_type:
-        # Structure diagonale ou proche
-        # [ λ1   0  ]  ou  [ λ1   ε ]
-        # [  0  λ2 ]       [  0  λ2 ]
-        lambda1, lambda2 = calculate_eigenvalues(tau, delta)
-        eps = (
-            0.1
-            if "degenere" not in eq_type
-            and "d\u00e9g\u00e9n\u00e9r\u00e9" not in eq_type
-            else 0
-        )
-        return (lambda1.real, eps, 0, lambda2.real)
-
-    # Centre: structure antisymétrique
-    elif "centre" in eq_type:
-        # Structure: [  0   β ]
-        #            [ -β   0 ]
-        # τ = 0, Δ = β²
-        beta = delta**0.5 if delta > 0 else 1.0
-        return (0, beta, -beta, 0)
-
-    # Selle: une valeur propre positive, une négative
-    elif "selle" in eq_type:
-        # Structure: [ λ1   0 ]  where λ1 > 0, λ2 < 0
-        #            [  0  λ2 ]
-        lambda1, lambda2 = calculate_eigenvalues(tau, delta)
-        return (lambda1.real, 0.5, 0.5, lambda2.real)
-
-    # Mouvement uniforme: structure où une variable ne varie pas
-    elif "mouvement" in eq_type or "uniforme" in eq_type:
-        # Structure: [  0   1 ]  (ou similaire)
-        #            [  0   0 ]
-        # Représente: dx₁/dt = x₂, dx₂/dt = 0
-        # Une valeur propre nulle (pas d'accélération)
-        return (0, 1, 0, 0)
-
-    # Ligne de points d'équilibre
-    elif "ligne" in eq_type:
-        # Une valeur propre nulle, une non-nulle
-        # [ λ   0 ]
-        # [ 0   0 ]
-        lambda_val = tau  # La seule valeur propre non-nulle
-        return (lambda_val, 0.1, 0, 0)
 
-    # Par défaut: utiliser la méthode générique
-    else:
-        return tau_delta_to_matrix(tau, delta)
+def calculate_eigenvalue_parts(
+    tau: float, delta: float
+) -> Tuple[float, float, float, float]:
+    """
+    Calculate the real and imaginary parts of the eigenvalues as plain floats.
+
+    Same formula as calculate_eigenvalues, for callers that only need the
+    parts: no complex objects are created.
+
+    Args:
+        tau: Trace of the system matrix
+        delta: Determinant of the system matrix
+
+    Returns:
+        Tuple (Re λ₁, Im λ₁, Re λ₂, Im λ₂), with Im λ₁ ≥ 0
+        (memoized per rounded (τ, Δ))
+    """
+    return _calculate_eigenvalue_parts_cached(_cache_key(tau), _cache_key(delta))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _calculate_eigenvalue_parts_cached(
+    tau: float, delta: float
+) -> Tuple[float, float, float, float]:
+    """Cached implementation of calculate_eigenvalue_parts (keys already snapped)."""
+    discriminant = tau * tau - 4 * delta
+    half_tau = 0.5 * tau
+
+    if discriminant >= 0:
+        # Real eigenvalues
+        half_sqrt = 0.5 * math.sqrt(discriminant)
+        return half_tau + half_sqrt, 0.0, half_tau - half_sqrt, 0.0
+
+    # Complex conjugate eigenvalues
+    half_sqrt = 0.5 * math.sqrt(-discriminant)
+    return half_tau, half_sqrt, half_tau, -half_sqrt
 
 
 def calculate_eigenvalues(tau: float, delta: float) -> Tuple[complex, complex]:
@@ -161,22 +250,11 @@ def calculate_eigenvalues(tau: float, delta: float) -> Tuple[complex, complex]:
         delta: Determinant of the system matrix
 
     Returns:
-        Tuple of two eigenvalues (may be complex)
+        Tuple of two eigenvalues as complex numbers (imaginary part is 0.0
+        when the discriminant is non-negative)
     """
-    discriminant = tau**2 - 4 * delta
-
-    if discriminant >= 0:
-        # Real eigenvalues
-        sqrt_disc = np.sqrt(discriminant)
-        lambda1 = (tau + sqrt_disc) / 2
-        lambda2 = (tau - sqrt_disc) / 2
-    else:
-        # Complex eigenvalues
-        sqrt_disc = np.sqrt(-discriminant) * 1j
-        lambda1 = (tau + sqrt_disc) / 2
-        lambda2 = (tau - sqrt_disc) / 2
-
-    return lambda1, lambda2
+    re1, im1, re2, im2 = calculate_eigenvalue_parts(tau, delta)
+    return complex(re1, im1), complex(re2, im2)
 
 
 def classify_equilibrium(tau: float, delta: float) -> str:
@@ -205,46 +283,68 @@ def classify_equilibrium(tau: float, delta: float) -> str:
         delta: Determinant of the system matrix (Δ = ad - bc = λ₁ × λ₂)
 
     Returns:
-        String describing the equilibrium type
+        String describing the equilibrium type (memoized per rounded (τ, Δ))
     """
-    TOL = 1e-10  # Tolerance for numerical comparisons
+    return _classify_equilibrium_cached(_cache_key(tau), _cache_key(delta))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _classify_equilibrium_cached(tau: float, delta: float) -> str:
+    """Cached implementation of classify_equilibrium (keys already snapped)."""
+    discriminant = tau * tau - 4 * delta
+    return _CLASSIFICATION_TABLE[(_sign(tau), _sign(delta), _sign(discriminant))]
+
+
+_CLASSIFICATION_TOL = 1e-10  # Tolerance for numerical comparisons
 
-    # Calculate discriminant for parabola comparison
-    discriminant = tau**2 - 4 * delta
 
+def _sign(value: float) -> int:
+    """Ternary sign with tolerance: 0 when |value| is within the tolerance."""
+    if value > _CLASSIFICATION_TOL:
+        return 1
+    if value < -_CLASSIFICATION_TOL:
+        return -1
+    return 0
+
+
+def _classify_signs(tau_sign: int, delta_sign: int, disc_sign: int) -> str:
+    """
+    Apply the classification rules of classify_equilibrium to the signs of
+    (τ, Δ, τ² - 4Δ). Only used at import time to fill _CLASSIFICATION_TABLE.
+    """
     # === CAS 1: Origin (τ = 0, Δ = 0) ===
-    if abs(tau) < TOL and abs(delta) < TOL:
+    if tau_sign == 0 and delta_sign == 0:
         return "Mouvement uniforme"
 
     # === CAS 2: τ = 0, Δ > 0 (Centre) ===
-    if abs(tau) < TOL and delta > TOL:
+    if tau_sign == 0 and delta_sign > 0:
         return "Centre"
 
     # === CAS 3: Δ < 0 (Selle) ===
     # Eigenvalues have opposite signs (λ₁ × λ₂ < 0)
-    if delta < -TOL:
+    if delta_sign < 0:
         return "Point selle (instable)"
 
     # === CAS 4: Δ ≈ 0, τ ≠ 0 (Ligne de points d'équilibre) ===
     # One eigenvalue is zero, the other is τ
-    if abs(delta) < TOL and abs(tau) > TOL:
-        if tau < 0:
+    if delta_sign == 0:
+        if tau_sign < 0:
             return "Ligne de points d'équilibre (stable)"
         else:
             return "Ligne de points d'équilibre (instable)"
 
     # === CAS 5: Sur la parabole (discriminant ≈ 0) ===
     # Valeur propre double réelle: λ = τ/2
-    if abs(discriminant) < TOL:
-        if tau < 0:
+    if disc_sign == 0:
+        if tau_sign < 0:
             return "Nœud dégénéré stable"
         else:
             return "Nœud dégénéré instable"
 
     # === CAS 6: Au-dessus de la parabole (discriminant < 0) ===
     # Valeurs propres complexes conjuguées: λ = (τ ± i√|discriminant|) / 2
-    if discriminant < -TOL:
-        if tau < 0:
+    if disc_sign < 0:
+        if tau_sign < 0:
             return "Foyer stable"
         else:
             return "Foyer instable"
@@ -252,8 +352,8 @@ def classify_equilibrium(tau: float, delta: float) -> str:
     # === CAS 7: En-dessous de la parabole (discriminant > 0, Δ > 0) ===
     # Valeurs propres réelles distinctes de même signe
     # λ₁ = (τ + √discriminant) / 2,  λ₂ = (τ - √discriminant) / 2
-    if discriminant > TOL and delta > TOL:
-        if tau < 0:
+    if disc_sign > 0 and delta_sign > 0:
+        if tau_sign < 0:
             return "Nœud stable"
         else:
             return "Nœud instable"
@@ -262,6 +362,21 @@ def classify_equilibrium(tau: float, delta: float) -> str:
     return "Type indéterminé"
 
 
+# (sign τ, sign Δ, sign discriminant) -> type: the 27 combinations are
+# resolved once, classification is then a single dictionary lookup.
+_CLASSIFICATION_TABLE: Dict[Tuple[int, int, int], str] = {
+    signs: _classify_signs(*signs) for signs in product((-1, 0, 1), repeat=3)
+}
+
+
+def _format_hover_eigenvalue(re: float, im: float) -> str:
+    """Eigenvalue as "re" when real, else "re ± |im|i" (3 decimals)."""
+    if im == 0:
+        return f"{re:.3f}"
+    sign = "+" if im > 0 else "-"
+    return f"{re:.3f} {sign} {abs(im):.3f}i"
+
+
 def create_eigenvalue_plot(tau: float, delta: float) -> go.Figure:
     """
     Create a plot showing the eigenvalues in the complex plane.
@@ -273,15 +388,15 @@ def create_eigenvalue_plot(tau: float, delta: float) -> go.Figure:
     Returns:
         Plotly figure showing eigenvalues
     """
-    lambda1, lambda2 = calculate_eigenvalues(tau, delta)
+    re1, im1, re2, im2 = calculate_eigenvalue_parts(tau, delta)
 
     fig = go.Figure()
 
     # Add eigenvalues as scatter points
     fig.add_trace(
         go.Scatter(
-            x=[lambda1.real, lambda2.real],
-            y=[lambda1.imag, lambda2.imag],
+            x=[re1, re2],
+            y=[im1, im2],
             mode="markers",
             marker=dict(
                 size=15,
@@ -289,22 +404,16 @@ def create_eigenvalue_plot(tau: float, delta: float) -> go.Figure:
                 line=dict(width=2, color=PALETTE.surface),
             ),
             name="Valeurs propres",
-            text=[f"λ₁ = {lambda1:.3f}", f"λ₂ = {lambda2:.3f}"],
+            text=[
+                f"λ₁ = {_format_hover_eigenvalue(re1, im1)}",
+                f"λ₂ = {_format_hover_eigenvalue(re2, im2)}",
+            ],
             hovertemplate="%{text}<extra></extra>",
         )
     )
 
     # Add axes
-    max_range = (
-        max(
-            abs(lambda1.real),
-            abs(lambda1.imag),
-            abs(lambda2.real),
-            abs(lambda2.imag),
-            1,
-        )
-        * 1.2
-    )
+    max_range = max(abs(re1), abs(im1), abs(re2), abs(im2), 1) * 1.2
 
     fig.add_shape(
         type="line",
@@ -360,24 +469,47 @@ def create_eigenvalue_plot(tau: float, delta: float) -> go.Figure:
     return fig
 
 
-def format_eigenvalue_display(tau: float, delta: float) -> Dict:
+# (label, color) pairs reported by format_eigenvalue_display
+_STABILITY_UNIFORM = ("Marginalement stable (mouvement uniforme)", PALETTE.accent_amber)
+_STABILITY_STABLE = ("Stable", PALETTE.secondary)
+_STABILITY_UNSTABLE = ("Instable", PALETTE.accent_red)
+_STABILITY_MARGINAL = ("Marginalement stable", PALETTE.accent_amber)
+
+
+@dataclass(frozen=True)
+class EigenvalueDisplay:
+    """Formatted eigenvalue information returned by format_eigenvalue_display."""
+
+    lambda1: str
+    lambda2: str
+    eigenvalues: str  # "λ₁ = …, λ₂ = …"
+    nature: str
+    eq_type: str  # Same label as classify_equilibrium
+    stability: str
+    stability_color: str
+
+
+def format_eigenvalue_display(tau: float, delta: float) -> EigenvalueDisplay:
     """
     Format eigenvalue information for display, including the special case of uniform motion.
     Args:
         tau: Trace value
         delta: Determinant value
     Returns:
-        Dictionary with formatted eigenvalue information
+        Frozen EigenvalueDisplay (memoized per rounded (τ, Δ), safe to share)
     """
-    lambda1, lambda2 = calculate_eigenvalues(tau, delta)
-    eq_type = classify_equilibrium(tau, delta)
+    return _format_eigenvalue_display_cached(_cache_key(tau), _cache_key(delta))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _format_eigenvalue_display_cached(tau: float, delta: float) -> EigenvalueDisplay:
+    """Cached implementation of format_eigenvalue_display (keys already snapped)."""
+    re1, im1, re2, im2 = _calculate_eigenvalue_parts_cached(tau, delta)
+    eq_type = _classify_equilibrium_cached(tau, delta)
 
     # Check for uniform motion (both eigenvalues are zero or very close to zero)
     is_uniform_motion = (
-        abs(lambda1.real) < 1e-10
-        and abs(lambda1.imag) < 1e-10
-        and abs(lambda2.real) < 1e-10
-        and abs(lambda2.imag) < 1e-10
+        abs(re1) < 1e-10 and abs(im1) < 1e-10 and abs(re2) < 1e-10 and abs(im2) < 1e-10
     )
 
     # Format eigenvalues
@@ -385,39 +517,35 @@ def format_eigenvalue_display(tau: float, delta: float) -> Dict:
         lambda1_str = "0"
         lambda2_str = "0"
         nature = "Mouvement uniforme (valeurs propres nulles, pas de point d'équilibre, sauf si système statique, alors tous les points sont des points d'équilibre)"
-    elif abs(lambda1.imag) < 1e-10:
+    elif abs(im1) < 1e-10:
         # Real eigenvalues
-        lambda1_str = f"{lambda1.real:.4f}"
-        lambda2_str = f"{lambda2.real:.4f}"
+        lambda1_str = f"{re1:.4f}"
+        lambda2_str = f"{re2:.4f}"
         nature = "Valeurs propres réelles"
     else:
         # Complex eigenvalues
-        real_part = lambda1.real
-        imag_part = abs(lambda1.imag)
+        real_part = re1
+        imag_part = abs(im1)
         lambda1_str = f"{real_part:.4f} + {imag_part:.4f}i"
         lambda2_str = f"{real_part:.4f} - {imag_part:.4f}i"
         nature = "Valeurs propres complexes conjuguées"
 
     # Stability
     if is_uniform_motion:
-        stability = "Marginalement stable (mouvement uniforme)"
-        stability_color = PALETTE.accent_amber
-    elif lambda1.real < -1e-10 and lambda2.real < -1e-10:
-        stability = "Stable"
-        stability_color = PALETTE.secondary
-    elif lambda1.real > 1e-10 or lambda2.real > 1e-10:
-        stability = "Instable"
-        stability_color = PALETTE.accent_red
+        stability, stability_color = _STABILITY_UNIFORM
+    elif re1 < -1e-10 and re2 < -1e-10:
+        stability, stability_color = _STABILITY_STABLE
+    elif re1 > 1e-10 or re2 > 1e-10:
+        stability, stability_color = _STABILITY_UNSTABLE
     else:
-        stability = "Marginalement stable"
-        stability_color = PALETTE.accent_amber
-
-    return {
-        "lambda1": lambda1_str,
-        "lambda2": lambda2_str,
-        "eigenvalues": f"λ₁ = {lambda1_str}, λ₂ = {lambda2_str}",
-        "nature": nature,
-        "type": eq_type,
-        "stability": stability,
-        "stability_color": stability_color,
-    }
+        stability, stability_color = _STABILITY_MARGINAL
+
+    return EigenvalueDisplay(
+        lambda1=lambda1_str,
+        lambda2=lambda2_str,
+        eigenvalues=f"λ₁ = {lambda1_str}, λ₂ = {lambda2_str}",
+        nature=nature,
+        eq_type=eq_type,
+        stability=stability,
+        stability_color=stability_color,
+    )
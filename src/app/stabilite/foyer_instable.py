@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
 
 import plotly.graph_objects as go
-from dash import Input, Output, html  # type: ignore
+from dash import html  # type: ignore
 
 from src.app.stabilite.base_callbacks import register_stability_callbacks
 from src.app.stabilite.base_figures import create_phase_diagram
-from src.app.stabilite.base_layout import build_stability_layout, stability_ids
+from src.app.stabilite.base_layout import stability_ids
 
 # Clé de page pour "Centre"
 PAGE_KEY = "foyer_instable"
@@ -30,6 +30,7 @@ def get_ids() -> dict[str, str]:
     return stability_ids(PAGE_KEY)
 
 
+@lru_cache(maxsize=1)
 def create_figure() -> go.Figure:
     """
     Crée le diagramme de phase pour un foyer instable.
@@ -56,38 +57,41 @@ def get_constraints() -> dict:
     }
 
 
+_LAYOUT_PEDAGOGIC = html.Div(
+    [
+        html.P(
+            "Un point d’équilibre est un foyer instable lorsque les valeurs propres sont complexes conjuguées avec une partie réelle strictement positive. Les trajectoires tournent autour de l’équilibre mais s’en éloignent de plus en plus. La partie réelle positive entraîne une croissance exponentielle, ce qui rend l’équilibre instable."
+        ),
+        html.H4("Exemple de la vie réelle :"),
+        html.Ul(
+            [
+                html.Li(
+                    "Le pendule inversé: Lorsqu'on place un pendule en position verticale avec le poids vers le haut, cette position est instable et lorsqu'on le perturbe légèrement, il bascule et s'éloigne de cette position d'équilibre instable."
+                ),
+                html.Li(
+                    "Le larsen acoustique: Est un équilibre instable quand un microphone capte le son d'un haut-parleur et que celui-ci est trop proche mais que le son n'est pas assez fort pour perturber l'équilibre. Cependant, dès qu'une petite perturbation augmente le volume, le son devient de plus en plus fort, s'éloignant ainsi de l'état initial instable."
+                ),
+            ]
+        ),
+        html.H4("Caractéristiques mathématiques:"),
+        html.Ul(
+            [
+                html.Li("$\\tau$ < 0"),
+                html.Li("$\\Delta$ > $\\tau^2/4$"),
+                html.Li("Racines complexes"),
+                html.Li("Partie réelle positive"),
+                html.Li("Comportement: instable oscillatoire"),
+            ]
+        ),
+    ]
+)
+
+
 def layout_pedagogic() -> html.Div:
     """
     Retourne le contenu pédagogique pour la page Foyer instable.
     """
-    return html.Div(
-        [
-            html.P(
-                "Un point d’équilibre est un foyer instable lorsque les valeurs propres sont complexes conjuguées avec une partie réelle strictement positive. Les trajectoires tournent autour de l’équilibre mais s’en éloignent de plus en plus. La partie réelle positive entraîne une croissance exponentielle, ce qui rend l’équilibre instable."
-            ),
-            html.H4("Exemple de la vie réelle :"),
-            html.Ul(
-                [
-                    html.Li(
-                        "Le pendule inversé: Lorsqu'on place un pendule en position verticale avec le poids vers le haut, cette position est instable et lorsqu'on le perturbe légèrement, il bascule et s'éloigne de cette position d'équilibre instable."
-                    ),
-                    html.Li(
-                        "Le larsen acoustique: Est un équilibre instable quand un microphone capte le son d'un haut-parleur et que celui-ci est trop proche mais que le son n'est pas assez fort pour perturber l'équilibre. Cependant, dès qu'une petite perturbation augmente le volume, le son devient de plus en plus fort, s'éloignant ainsi de l'état initial instable."
-                    ),
-                ]
-            ),
-            html.H4("Caractéristiques mathématiques:"),
-            html.Ul(
-                [
-                    html.Li("$\\tau$ < 0"),
-                    html.Li("$\\Delta$ > $\\tau^2/4$"),
-                    html.Li("Racines complexes"),
-                    html.Li("Partie réelle positive"),
-                    html.Li("Comportement: instable oscillatoire"),
-                ]
-            ),
-        ]
-    )
+    return _LAYOUT_PEDAGOGIC
 
 
 def register_callbacks(app) -> None:
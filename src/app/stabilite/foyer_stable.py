@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
 
 import plotly.graph_objects as go
-from dash import Input, Output, html
+from dash import html
 
 from src.app.stabilite.base_callbacks import register_stability_callbacks
 from src.app.stabilite.base_figures import create_phase_diagram
-from src.app.stabilite.base_layout import build_stability_layout, stability_ids
+from src.app.stabilite.base_layout import stability_ids
 
 # Clé de page pour "Foyer stable"
 PAGE_KEY = "foyer_stable"
@@ -30,6 +30,7 @@ def get_ids() -> dict[str, str]:
     return stability_ids(PAGE_KEY)
 
 
+@lru_cache(maxsize=1)
 def create_figure() -> go.Figure:
     """
     Crée le diagramme de phase pour un foyer stable.
@@ -60,37 +61,40 @@ def get_constraints() -> dict:
     }
 
 
+_LAYOUT_PEDAGOGIC = html.Div(
+    [
+        html.P(
+            "Un point d’équilibre est un foyer stable lorsque les valeurs propres du système sont complexes conjuguées avec une partie réelle strictement négative. Les trajectoires tournent autour du point d’équilibre tout en se rapprochant progressivement. La partie réelle négative provoque une décroissance exponentielle, ce qui rend l’équilibre asymptotiquement stable."
+        ),
+        html.H4("Exemple de la vie réelle :"),
+        html.Ul(
+            [
+                html.Li(
+                    "Une corde de guitare: Quand elle est jouée, elle oscille rapidement autour de sa position d'équilibre avant de s'arrêter progressivement."
+                ),
+                html.Li(
+                    "Une voiture avec amortisseurs: après un dos-d’âne, elle oscille de haut en bas puis revient à la position d'équilibre quand le choc a bien été amorti."
+                ),
+            ]
+        ),
+        html.H4("Caractéristiques mathématiques:"),
+        html.Ul(
+            [
+                html.Li("$\\tau < 0$ (trace négative)"),
+                html.Li("$\\Delta > \\tau^2/4$ (racines complexes)"),
+                html.Li("Partie réelle négative"),
+                html.Li("Comportement: stable oscillatoire amorti"),
+            ]
+        ),
+    ]
+)
+
+
 def layout_pedagogic() -> html.Div:
     """
     Retourne le contenu pédagogique pour la page Foyer stable.
     """
-    return html.Div(
-        [
-            html.P(
-                "Un point d’équilibre est un foyer stable lorsque les valeurs propres du système sont complexes conjuguées avec une partie réelle strictement négative. Les trajectoires tournent autour du point d’équilibre tout en se rapprochant progressivement. La partie réelle négative provoque une décroissance exponentielle, ce qui rend l’équilibre asymptotiquement stable."
-            ),
-            html.H4("Exemple de la vie réelle :"),
-            html.Ul(
-                [
-                    html.Li(
-                        "Une corde de guitare: Quand elle est jouée, elle oscille rapidement autour de sa position d'équilibre avant de s'arrêter progressivement."
-                    ),
-                    html.Li(
-                        "Une voiture avec amortisseurs: après un dos-d’âne, elle oscille de haut en bas puis revient à la position d'équilibre quand le choc a bien été amorti."
-                    ),
-                ]
-            ),
-            html.H4("Caractéristiques mathématiques:"),
-            html.Ul(
-                [
-                    html.Li("$\\tau < 0$ (trace négative)"),
-                    html.Li("$\\Delta > \\tau^2/4$ (racines complexes)"),
-                    html.Li("Partie réelle négative"),
-                    html.Li("Comportement: stable oscillatoire amorti"),
-                ]
-            ),
-        ]
-    )
+    return _LAYOUT_PEDAGOGIC
 
 
 def register_callbacks(app) -> None:
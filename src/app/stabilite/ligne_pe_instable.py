@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import plotly.graph_objects as go
 from dash import html  # type: ignore
 
 from src.app.stabilite.base_callbacks import register_stability_callbacks
 from src.app.stabilite.base_figures import create_phase_diagram
-from src.app.stabilite.base_layout import build_stability_layout, stability_ids
+from src.app.stabilite.base_layout import stability_ids
 
 # Clé de page pour "Centre"
 PAGE_KEY = "ligne_pe_instable"
@@ -28,6 +30,7 @@ def get_ids() -> dict[str, str]:
     return stability_ids(PAGE_KEY)
 
 
+@lru_cache(maxsize=1)
 def create_figure() -> go.Figure:
     """
     Crée le diagramme de phase pour une ligne propre instable.
@@ -54,38 +57,39 @@ def get_constraints() -> dict:
     }
 
 
+_LAYOUT_PEDAGOGIC = html.Div(
+    [
+        html.P(
+            "On obtient une ligne d’équilibres instables lorsqu’une valeur propre est nulle et l’autre est positive. Tous les points situés sur la direction associée à la valeur propre nulle sont des équilibres, mais toute perturbation dans la direction correspondante à la valeur propre positive s’en éloigne ce qui rend le système instable."
+        ),
+        html.H4("Exemple de la vie réelle :"),
+        html.Ul(
+            [
+                html.Li(
+                    "Un bâton placé verticalement en équilibre instable coincé entre deux murs: Une petite perturbation le fait tomber dans l'une des deux directions ou les murs n'empêchent pas sa chute."
+                ),
+                html.Li(
+                    "Un système de population avec un seuil critique: Si la population tombe en dessous d'un certain seuil, elle s'effondre, sinon elle croît indéfiniment."
+                ),
+            ]
+        ),
+        html.H4("Caractéristiques mathématiques:"),
+        html.Ul(
+            [
+                html.Li("Deux racines réelles"),
+                html.Li("Au moins une racine positive"),
+                html.Li("Convergence sur une ligne, divergence dans autres directions"),
+            ]
+        ),
+    ]
+)
+
+
 def layout_pedagogic() -> html.Div:
     """
     Retourne le contenu pédagogique pour la page Ligne propre instable.
     """
-    return html.Div(
-        [
-            html.P(
-                "On obtient une ligne d’équilibres instables lorsqu’une valeur propre est nulle et l’autre est positive. Tous les points situés sur la direction associée à la valeur propre nulle sont des équilibres, mais toute perturbation dans la direction correspondante à la valeur propre positive s’en éloigne ce qui rend le système instable."
-            ),
-            html.H4("Exemple de la vie réelle :"),
-            html.Ul(
-                [
-                    html.Li(
-                        "Un bâton placé verticalement en équilibre instable coincé entre deux murs: Une petite perturbation le fait tomber dans l'une des deux directions ou les murs n'empêchent pas sa chute."
-                    ),
-                    html.Li(
-                        "Un système de population avec un seuil critique: Si la population tombe en dessous d'un certain seuil, elle s'effondre, sinon elle croît indéfiniment."
-                    ),
-                ]
-            ),
-            html.H4("Caractéristiques mathématiques:"),
-            html.Ul(
-                [
-                    html.Li("Deux racines réelles"),
-                    html.Li("Au moins une racine positive"),
-                    html.Li(
-                        "Convergence sur une ligne, divergence dans autres directions"
-                    ),
-                ]
-            ),
-        ]
-    )
+    return _LAYOUT_PEDAGOGIC
 
 
 def register_callbacks(app) -> None:
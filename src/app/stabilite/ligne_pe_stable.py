@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import plotly.graph_objects as go
 from dash import html  # type: ignore
 
 from src.app.stabilite.base_callbacks import register_stability_callbacks
 from src.app.stabilite.base_figures import create_phase_diagram
-from src.app.stabilite.base_layout import build_stability_layout, stability_ids
+from src.app.stabilite.base_layout import stability_ids
 
 # Clé de page pour "Centre"
 PAGE_KEY = "ligne_pe_stable"
@@ -28,6 +30,7 @@ def get_ids() -> dict[str, str]:
     return stability_ids(PAGE_KEY)
 
 
+@lru_cache(maxsize=1)
 def create_figure() -> go.Figure:
     """
     Crée le diagramme de phase pour une ligne propre stable.
@@ -54,33 +57,36 @@ def get_constraints() -> dict:
     }
 
 
+_LAYOUT_PEDAGOGIC = html.Div(
+    [
+        html.P(
+            "Lorsque le système possède une valeur propre nulle et une valeur propre négative, on a une ligne d’équilibres stables. Les trajectoires convergent vers cette ligne (direction négative) mais restent ensuite sur celle-ci (direction nulle). Le système est stable au sens de Lyapunov, mais pas asymptotiquement stable puisqu’on ne converge pas vers un point unique."
+        ),
+        html.H4("Exemple de la vie réelle :"),
+        html.Ul(
+            [
+                html.Li(
+                    "Un joystick de drone: Le joystick peut rester dans une position stable le long d'une ligne, mais toute déviation perpendiculaire le fait revenir à cette position stable instantanément et sans oscillation."
+                ),
+            ]
+        ),
+        html.H4("Caractéristiques mathématiques:"),
+        html.Ul(
+            [
+                html.Li("Deux racines réelles"),
+                html.Li("Les deux racines sont négatives"),
+                html.Li("Convergence linéaire vers le point d'équilibre"),
+            ]
+        ),
+    ]
+)
+
+
 def layout_pedagogic() -> html.Div:
     """
     Retourne le contenu pédagogique pour la page Ligne propre stable.
     """
-    return html.Div(
-        [
-            html.P(
-                "Lorsque le système possède une valeur propre nulle et une valeur propre négative, on a une ligne d’équilibres stables. Les trajectoires convergent vers cette ligne (direction négative) mais restent ensuite sur celle-ci (direction nulle). Le système est stable au sens de Lyapunov, mais pas asymptotiquement stable puisqu’on ne converge pas vers un point unique."
-            ),
-            html.H4("Exemple de la vie réelle :"),
-            html.Ul(
-                [
-                    html.Li(
-                        "Un joystick de drone: Le joystick peut rester dans une position stable le long d'une ligne, mais toute déviation perpendiculaire le fait revenir à cette position stable instantanément et sans oscillation."
-                    ),
-                ]
-            ),
-            html.H4("Caractéristiques mathématiques:"),
-            html.Ul(
-                [
-                    html.Li("Deux racines réelles"),
-                    html.Li("Les deux racines sont négatives"),
-                    html.Li("Convergence linéaire vers le point d'équilibre"),
-                ]
-            ),
-        ]
-    )
+    return _LAYOUT_PEDAGOGIC
 
 
 def register_callbacks(app) -> None:
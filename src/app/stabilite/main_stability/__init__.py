@@ -9,7 +9,7 @@ Ce module organise la page principale de stabilité en plusieurs sous-modules :
 """
 
 from .callbacks import register_callbacks
-from .constants import get_ids
+from .constants import IDS, get_ids
 from .layout import build_layout
 
-__all__ = ["get_ids", "build_layout", "register_callbacks"]
+__all__ = ["IDS", "get_ids", "build_layout", "register_callbacks"]
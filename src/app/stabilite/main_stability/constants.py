@@ -2,20 +2,44 @@
 Constantes et identifiants pour la page principale de stabilité.
 """
 
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from types import MappingProxyType
 
+# Pas des sliders τ et Δ, partagé par le layout et les clés de cache des
+# figures (plots.py)
+SLIDER_STEP = 0.1
+
+
+@dataclass(frozen=True)
+class ComponentIds:
+    """Identifiants des composants de la page, accessibles par attribut."""
+
+    tau_slider: str = "main-stab-tau-slider"
+    delta_slider: str = "main-stab-delta-slider"
+    system_graph: str = "main-stab-system-graph"
+    phase_diagram: str = "main-stab-phase-diagram"
+    eigenvalue_display: str = "main-stab-eigenvalue-display"
+    eigenvalue_values: str = "main-stab-eigenvalue-values"
+    eigenvalue_nature: str = "main-stab-eigenvalue-nature"
+    ode_display: str = "main-stab-ode-display"
+    equilibrium_type: str = "main-stab-equilibrium-type"
+    legend_trajectories: str = "main-stab-legend-trajectories"
+    legend_isoclines: str = "main-stab-legend-isoclines"
+    legend_eigenvectors: str = "main-stab-legend-eigenvectors"
+    legend_vectors: str = "main-stab-legend-vectors"
+    legend_equilibrium: str = "main-stab-legend-equilibrium"
+
+
+IDS = ComponentIds()
+
+
+@lru_cache(maxsize=1)
 def get_ids():
-    """Retourne les identifiants des composants de la page."""
-    return {
-        "tau_slider": "main-stab-tau-slider",
-        "delta_slider": "main-stab-delta-slider",
-        "system_graph": "main-stab-system-graph",
-        "phase_diagram": "main-stab-phase-diagram",
-        "eigenvalue_display": "main-stab-eigenvalue-display",
-        "ode_display": "main-stab-ode-display",
-        "equilibrium_type": "main-stab-equilibrium-type",
-        "legend_trajectories": "main-stab-legend-trajectories",
-        "legend_isoclines": "main-stab-legend-isoclines",
-        "legend_eigenvectors": "main-stab-legend-eigenvectors",
-        "legend_vectors": "main-stab-legend-vectors",
-        "legend_equilibrium": "main-stab-legend-equilibrium",
-    }
+    """
+    Retourne les identifiants des composants de la page sous forme de dict.
+
+    Vue en lecture seule de IDS, construite une seule fois; conservée pour
+    les appelants qui indexent par clé.
+    """
+    return MappingProxyType(asdict(IDS))
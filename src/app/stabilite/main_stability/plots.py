@@ -1,11 +1,101 @@
 """
 Fonctions de génération de graphiques pour la page principale de stabilité.
 
-Ce module peut contenir des fonctions supplémentaires de génération de graphiques
-spécifiques à la page principale si nécessaire. Pour l'instant, il réexporte
-les fonctions de base depuis base_figures.
+Les figures des sliders sont mémoïsées par position (τ, Δ) et renvoyées déjà
+sérialisées (dict prêt pour JSON, tableaux typés encodés en base64): revenir
+sur une position ne recalcule ni les trajectoires ni l'encodage JSON. Le
+graphique temporel garde la même structure d'une position à l'autre: seules ses
+données sont renvoyées (Patch). Les fonctions de base de base_figures restent
+réexportées.
 """
 
-from ..base_figures import create_phase_diagram, create_system_graph
+from __future__ import annotations
 
-__all__ = ["create_system_graph", "create_phase_diagram"]
+from functools import lru_cache
+from typing import Any, Dict
+
+from dash import Patch
+
+from ..base_figures import (
+    create_phase_diagram,
+    create_system_graph,
+    figure_to_plain_dict,
+)
+from ..eigenvalue_utils import tau_delta_to_matrix
+from .constants import SLIDER_STEP
+
+# Positions (τ, Δ) gardées en mémoire par graphique
+_FIGURE_CACHE_SIZE = 128
+
+# Valeur constante de layout.uirevision: Plotly.react conserve le zoom, le
+# déplacement et les traces masquées par l'utilisateur d'un tick à l'autre
+_UIREVISION = "main-stability"
+
+
+def _slider_key(value: float) -> float:
+    """
+    Position de slider ramenée au multiple de SLIDER_STEP le plus proche, utilisée
+    comme clé de cache: 0.30000000000000004 et 0.3 désignent la même position.
+    """
+    return round(round(float(value) / SLIDER_STEP) * SLIDER_STEP, 12)
+
+
+def system_graph_figure(tau: float, delta: float) -> Dict[str, Any]:
+    """
+    Graphique d'évolution temporelle x₁(t), x₂(t) pour (τ, Δ).
+
+    Le dict renvoyé est partagé entre les appels: ne pas le modifier.
+    """
+    return _system_graph_figure_cached(_slider_key(tau), _slider_key(delta))
+
+
+@lru_cache(maxsize=_FIGURE_CACHE_SIZE)
+def _system_graph_figure_cached(tau: float, delta: float) -> Dict[str, Any]:
+    """Implémentation mémoïsée de system_graph_figure (clés déjà arrondies)."""
+    a, b, c, d = tau_delta_to_matrix(tau, delta)
+    fig = create_system_graph(a, b, c, d, (1.0, 0.5), "Évolution temporelle du système")
+    fig.update_layout(uirevision=_UIREVISION)
+    return figure_to_plain_dict(fig)
+
+
+def system_graph_patch(tau: float, delta: float) -> Patch:
+    """
+    Mise à jour partielle du graphique temporel pour (τ, Δ).
+
+    Les deux courbes x₁(t), x₂(t) et le layout ne changent pas d'une position
+    à l'autre: seuls leurs tableaux x et y (déjà encodés en base64) sont envoyés
+    au navigateur. Suppose la figure déjà rendue (voir layout.py).
+    """
+    figure = system_graph_figure(tau, delta)
+    patch = Patch()
+    for index, trace in enumerate(figure["data"]):
+        patch["data"][index]["x"] = trace["x"]
+        patch["data"][index]["y"] = trace["y"]
+    return patch
+
+
+def phase_diagram_figure(tau: float, delta: float) -> Dict[str, Any]:
+    """
+    Portrait de phase pour (τ, Δ).
+
+    Le dict renvoyé est partagé entre les appels: ne pas le modifier.
+    """
+    return _phase_diagram_figure_cached(_slider_key(tau), _slider_key(delta))
+
+
+@lru_cache(maxsize=_FIGURE_CACHE_SIZE)
+def _phase_diagram_figure_cached(tau: float, delta: float) -> Dict[str, Any]:
+    """Implémentation mémoïsée de phase_diagram_figure (clés déjà arrondies)."""
+    a, b, c, d = tau_delta_to_matrix(tau, delta)
+    fig = create_phase_diagram(a, b, c, d, "Portrait de phase")
+    fig.update_layout(uirevision=_UIREVISION)
+    return figure_to_plain_dict(fig)
+
+
+__all__ = [
+    "create_system_graph",
+    "create_phase_diagram",
+    "system_graph_figure",
+    "system_graph_patch",
+    "phase_diagram_figure",
+]
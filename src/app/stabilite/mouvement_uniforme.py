@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import plotly.graph_objects as go
 from dash import html  # type: ignore
 
 from src.app.stabilite.base_callbacks import register_stability_callbacks
 from src.app.stabilite.base_figures import create_phase_diagram
-from src.app.stabilite.base_layout import build_stability_layout, stability_ids
+from src.app.stabilite.base_layout import stability_ids
 
 # Clé de page pour "Mouvement uniforme"
 PAGE_KEY = "mouvement_uniforme"
@@ -28,6 +30,7 @@ def get_ids() -> dict[str, str]:
     return stability_ids(PAGE_KEY)
 
 
+@lru_cache(maxsize=1)
 def create_figure() -> go.Figure:
     """
     Crée le diagramme de phase pour un mouvement uniforme.
@@ -63,37 +66,40 @@ def get_constraints() -> dict:
     }
 
 
+_LAYOUT_PEDAGOGIC = html.Div(
+    [
+        html.P(
+            "Un mouvement uniforme est un cas limite où le point d'équilibre n'existe pas ou est dégénéré. "
+            "Le système se déplace à une vitesse constante sans accélération."
+        ),
+        html.H4("Exemple de la vie réelle :"),
+        html.Ul(
+            [
+                html.Li(
+                    "Une voiture roulant à vitesse constante: En l'absence de forces externes (frottement, air), le système maintient une vitesse constante."
+                ),
+                html.Li(
+                    "Un objet flottant dans l'espace: Un objet sans forces extérieures continue à se déplacer à vitesse uniforme."
+                ),
+            ]
+        ),
+        html.H4("Caractéristiques mathématiques:"),
+        html.Ul(
+            [
+                html.Li("Cas critique: une ou deux racines nulles"),
+                html.Li("Pas de convergence vers un équilibre"),
+                html.Li("Trajectoires parallèles et linéaires"),
+            ]
+        ),
+    ]
+)
+
+
 def layout_pedagogic() -> html.Div:
     """
     Retourne le contenu pédagogique pour la page Mouvement uniforme.
     """
-    return html.Div(
-        [
-            html.P(
-                "Un mouvement uniforme est un cas limite où le point d'équilibre n'existe pas ou est dégénéré. "
-                "Le système se déplace à une vitesse constante sans accélération."
-            ),
-            html.H4("Exemple de la vie réelle :"),
-            html.Ul(
-                [
-                    html.Li(
-                        "Une voiture roulant à vitesse constante: En l'absence de forces externes (frottement, air), le système maintient une vitesse constante."
-                    ),
-                    html.Li(
-                        "Un objet flottant dans l'espace: Un objet sans forces extérieures continue à se déplacer à vitesse uniforme."
-                    ),
-                ]
-            ),
-            html.H4("Caractéristiques mathématiques:"),
-            html.Ul(
-                [
-                    html.Li("Cas critique: une ou deux racines nulles"),
-                    html.Li("Pas de convergence vers un équilibre"),
-                    html.Li("Trajectoires parallèles et linéaires"),
-                ]
-            ),
-        ]
-    )
+    return _LAYOUT_PEDAGOGIC
 
 
 def register_callbacks(app) -> None:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import plotly.graph_objects as go
 from dash import html  # type: ignore
 
 from src.app.stabilite.base_callbacks import register_stability_callbacks
 from src.app.stabilite.base_figures import create_phase_diagram
-from src.app.stabilite.base_layout import build_stability_layout, stability_ids
+from src.app.stabilite.base_layout import stability_ids
 
 # Clé de page pour "Centre"
 PAGE_KEY = "noeud_instable"
@@ -28,6 +30,7 @@ def get_ids() -> dict[str, str]:
     return stability_ids(PAGE_KEY)
 
 
+@lru_cache(maxsize=1)
 def create_figure() -> go.Figure:
     """
     Crée le diagramme de phase pour un nœud instable.
@@ -54,37 +57,40 @@ def get_constraints() -> dict:
     }
 
 
+_LAYOUT_PEDAGOGIC = html.Div(
+    [
+        html.P(
+            "Un point d’équilibre est un nœud instable lorsque les valeurs propres sont réelles, positives et éventuellement égales. Les trajectoires s’éloignent de l’équilibre sans osciller. La présence de valeurs propres positives implique une croissance exponentielle des perturbations ce qui rend l’équilibre instable."
+        ),
+        html.H4("Exemple de la vie réelle :"),
+        html.Ul(
+            [
+                html.Li(
+                    "Une boule de neige en état d'équilibre instable au sommet d'une colline: Une petite perturbation la fait dévaler la pente dans une direction quelconque."
+                ),
+                html.Li(
+                    "Un ballon gonflé à l'hélium coincé: Une petite perturbation le fait s'envoler s'éloignant du point d'équilibre."
+                ),
+            ]
+        ),
+        html.H4("Caractéristiques mathématiques:"),
+        html.Ul(
+            [
+                html.Li("$\\tau$ < 0"),
+                html.Li("0 < $\\Delta$ < $\\tau^2/4$"),
+                html.Li("Deux racines réelles positives"),
+                html.Li("Instable non oscillatoire"),
+            ]
+        ),
+    ]
+)
+
+
 def layout_pedagogic() -> html.Div:
     """
     Retourne le contenu pédagogique pour la page Nœud instable.
     """
-    return html.Div(
-        [
-            html.P(
-                "Un point d’équilibre est un nœud instable lorsque les valeurs propres sont réelles, positives et éventuellement égales. Les trajectoires s’éloignent de l’équilibre sans osciller. La présence de valeurs propres positives implique une croissance exponentielle des perturbations ce qui rend l’équilibre instable."
-            ),
-            html.H4("Exemple de la vie réelle :"),
-            html.Ul(
-                [
-                    html.Li(
-                        "Une boule de neige en état d'équilibre instable au sommet d'une colline: Une petite perturbation la fait dévaler la pente dans une direction quelconque."
-                    ),
-                    html.Li(
-                        "Un ballon gonflé à l'hélium coincé: Une petite perturbation le fait s'envoler s'éloignant du point d'équilibre."
-                    ),
-                ]
-            ),
-            html.H4("Caractéristiques mathématiques:"),
-            html.Ul(
-                [
-                    html.Li("$\\tau$ < 0"),
-                    html.Li("0 < $\\Delta$ < $\\tau^2/4$"),
-                    html.Li("Deux racines réelles positives"),
-                    html.Li("Instable non oscillatoire"),
-                ]
-            ),
-        ]
-    )
+    return _LAYOUT_PEDAGOGIC
 
 
 def register_callbacks(app) -> None:
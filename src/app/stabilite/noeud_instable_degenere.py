@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import plotly.graph_objects as go
 from dash import html  # type: ignore
 
 from src.app.stabilite.base_callbacks import register_stability_callbacks
 from src.app.stabilite.base_figures import create_phase_diagram
-from src.app.stabilite.base_layout import build_stability_layout, stability_ids
+from src.app.stabilite.base_layout import stability_ids
 
 # Clé de page pour "Nœud instable dégénéré"
 PAGE_KEY = "noeud_instable_degenere"
@@ -28,6 +30,7 @@ def get_ids() -> dict[str, str]:
     return stability_ids(PAGE_KEY)
 
 
+@lru_cache(maxsize=1)
 def create_figure() -> go.Figure:
     """
     Crée le diagramme de phase pour un nœud instable dégénéré.
@@ -54,33 +57,36 @@ def get_constraints() -> dict:
     }
 
 
+_LAYOUT_PEDAGOGIC = html.Div(
+    [
+        html.P(
+            "Un nœud instable dégénéré est un point d'équilibre critique où les trajectoires divergent linéairement dans une direction dégénérée."
+        ),
+        html.H4("Exemple de la vie réelle :"),
+        html.Ul(
+            [
+                html.Li(
+                    "Une toupie parfaitement équilibrée sur sa pointe tournant sur un dôme: La toupie reste en équilibre instable, et toute perturbation la fait diverger dans une direction."
+                ),
+            ]
+        ),
+        html.H4("Caractéristiques mathématiques:"),
+        html.Ul(
+            [
+                html.Li("Cas critique avec racines multiples"),
+                html.Li("Divergence linéaire dégénérée"),
+                html.Li("Comportement instable non oscillatoire"),
+            ]
+        ),
+    ]
+)
+
+
 def layout_pedagogic() -> html.Div:
     """
     Retourne le contenu pédagogique pour la page Nœud instable dégénéré.
     """
-    return html.Div(
-        [
-            html.P(
-                "Un nœud instable dégénéré est un point d'équilibre critique où les trajectoires divergent linéairement dans une direction dégénérée."
-            ),
-            html.H4("Exemple de la vie réelle :"),
-            html.Ul(
-                [
-                    html.Li(
-                        "Une toupie parfaitement équilibrée sur sa pointe tournant sur un dôme: La toupie reste en équilibre instable, et toute perturbation la fait diverger dans une direction."
-                    ),
-                ]
-            ),
-            html.H4("Caractéristiques mathématiques:"),
-            html.Ul(
-                [
-                    html.Li("Cas critique avec racines multiples"),
-                    html.Li("Divergence linéaire dégénérée"),
-                    html.Li("Comportement instable non oscillatoire"),
-                ]
-            ),
-        ]
-    )
+    return _LAYOUT_PEDAGOGIC
 
 
 def register_callbacks(app) -> None:
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
 
 import plotly.graph_objects as go
-from dash import Input, Output, html  # type: ignore
+from dash import html  # type: ignore
 
 from src.app.stabilite.base_callbacks import register_stability_callbacks
 from src.app.stabilite.base_figures import create_phase_diagram
-from src.app.stabilite.base_layout import build_stability_layout, stability_ids
+from src.app.stabilite.base_layout import stability_ids
 
 # Clé de page pour "Centre"
 PAGE_KEY = "noeud_stable"
@@ -30,6 +30,7 @@ def get_ids() -> dict[str, str]:
     return stability_ids(PAGE_KEY)
 
 
+@lru_cache(maxsize=1)
 def create_figure() -> go.Figure:
     """
     Crée le diagramme de phase pour un nœud stable.
@@ -56,37 +57,40 @@ def get_constraints() -> dict:
     }
 
 
+_LAYOUT_PEDAGOGIC = html.Div(
+    [
+        html.P(
+            "Un point d’équilibre est un noeud stable lorsque les valeurs propres sont réelles, négatives. Les trajectoires se dirigent vers l’équilibre sans osciller, en suivant des directions privilégiées correspondant aux vecteurs propres. Comme toutes les valeurs propres sont négatives, les perturbations décroissent exponentiellement ce qui rend l’équilibre asymptotiquement stable."
+        ),
+        html.H4("Exemple de la vie réelle:"),
+        html.Ul(
+            [
+                html.Li(
+                    "Une bille placée au bord d'une cuvette, qui va rouler vers le fond de celle-ci et s'y stabiliser sans oscillations lorsqu'on la perturbe légèrement, le fond de la cuvette représentant un noeud stable."
+                ),
+                html.Li(
+                    "Le cruise control d'une voiture: Lorsqu'on active le cruise control, le système ajuste automatiquement la vitesse de la voiture pour maintenir la vitesse cible constante. Si la voiture ralentit légèrement, le système augmente la puissance pour revenir à la vitesse définie, et vice versa, assurant ainsi une stabilité sans oscillations autour de la vitesse choisie."
+                ),
+            ]
+        ),
+        html.H4("Caractéristiques mathématiques:"),
+        html.Ul(
+            [
+                html.Li("$\\tau$ > 0"),
+                html.Li("0 < $\\Delta$ < $\\tau^2/4$"),
+                html.Li("Deux racines réelles négatives"),
+                html.Li("Stable non oscillatoire"),
+            ]
+        ),
+    ]
+)
+
+
 def layout_pedagogic() -> html.Div:
     """
     Retourne le contenu pédagogique pour la page Nœud stable.
     """
-    return html.Div(
-        [
-            html.P(
-                "Un point d’équilibre est un noeud stable lorsque les valeurs propres sont réelles, négatives. Les trajectoires se dirigent vers l’équilibre sans osciller, en suivant des directions privilégiées correspondant aux vecteurs propres. Comme toutes les valeurs propres sont négatives, les perturbations décroissent exponentiellement ce qui rend l’équilibre asymptotiquement stable."
-            ),
-            html.H4("Exemple de la vie réelle:"),
-            html.Ul(
-                [
-                    html.Li(
-                        "Une bille placée au bord d'une cuvette, qui va rouler vers le fond de celle-ci et s'y stabiliser sans oscillations lorsqu'on la perturbe légèrement, le fond de la cuvette représentant un noeud stable."
-                    ),
-                    html.Li(
-                        "Le cruise control d'une voiture: Lorsqu'on active le cruise control, le système ajuste automatiquement la vitesse de la voiture pour maintenir la vitesse cible constante. Si la voiture ralentit légèrement, le système augmente la puissance pour revenir à la vitesse définie, et vice versa, assurant ainsi une stabilité sans oscillations autour de la vitesse choisie."
-                    ),
-                ]
-            ),
-            html.H4("Caractéristiques mathématiques:"),
-            html.Ul(
-                [
-                    html.Li("$\\tau$ > 0"),
-                    html.Li("0 < $\\Delta$ < $\\tau^2/4$"),
-                    html.Li("Deux racines réelles négatives"),
-                    html.Li("Stable non oscillatoire"),
-                ]
-            ),
-        ]
-    )
+    return _LAYOUT_PEDAGOGIC
 
 
 def register_callbacks(app) -> None:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import plotly.graph_objects as go
 from dash import html  # type: ignore
 
 from src.app.stabilite.base_callbacks import register_stability_callbacks
 from src.app.stabilite.base_figures import create_phase_diagram
-from src.app.stabilite.base_layout import build_stability_layout, stability_ids
+from src.app.stabilite.base_layout import stability_ids
 
 # Clé de page pour "Nœud stable dégénéré"
 PAGE_KEY = "noeud_stable_degenere"
@@ -28,6 +30,7 @@ def get_ids() -> dict[str, str]:
     return stability_ids(PAGE_KEY)
 
 
+@lru_cache(maxsize=1)
 def create_figure() -> go.Figure:
     """
     Crée le diagramme de phase pour un nœud stable dégénéré.
@@ -54,33 +57,36 @@ def get_constraints() -> dict:
     }
 
 
+_LAYOUT_PEDAGOGIC = html.Div(
+    [
+        html.P(
+            "Un nœud stable dégénéré est un point d'équilibre critique où les trajectoires convergent linéairement vers le point fixe avec une légère déformation de la trajectoire avant l'arrivée."
+        ),
+        html.H4("Exemple de la vie réelle :"),
+        html.Ul(
+            [
+                html.Li(
+                    "Un système de ressorts parfaitement amortis: Le système revient à l'équilibre sans oscillations, le plus rapidement possible."
+                ),
+            ]
+        ),
+        html.H4("Caractéristiques mathématiques:"),
+        html.Ul(
+            [
+                html.Li("Racines réelles multiples (dégénérées)"),
+                html.Li("Les deux racines sont négatives et égales"),
+                html.Li("Convergence linéaire dégénérée"),
+            ]
+        ),
+    ]
+)
+
+
 def layout_pedagogic() -> html.Div:
     """
     Retourne le contenu pédagogique pour la page Nœud stable dégénéré.
     """
-    return html.Div(
-        [
-            html.P(
-                "Un nœud stable dégénéré est un point d'équilibre critique où les trajectoires convergent linéairement vers le point fixe avec une légère déformation de la trajectoire avant l'arrivée."
-            ),
-            html.H4("Exemple de la vie réelle :"),
-            html.Ul(
-                [
-                    html.Li(
-                        "Un système de ressorts parfaitement amortis: Le système revient à l'équilibre sans oscillations, le plus rapidement possible."
-                    ),
-                ]
-            ),
-            html.H4("Caractéristiques mathématiques:"),
-            html.Ul(
-                [
-                    html.Li("Racines réelles multiples (dégénérées)"),
-                    html.Li("Les deux racines sont négatives et égales"),
-                    html.Li("Convergence linéaire dégénérée"),
-                ]
-            ),
-        ]
-    )
+    return _LAYOUT_PEDAGOGIC
 
 
 def register_callbacks(app) -> None:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import plotly.graph_objects as go
 from dash import html  # type: ignore
 
 from src.app.stabilite.base_callbacks import register_stability_callbacks
 from src.app.stabilite.base_figures import create_phase_diagram
-from src.app.stabilite.base_layout import build_stability_layout, stability_ids
+from src.app.stabilite.base_layout import stability_ids
 
 # Clé de page pour "Selle"
 PAGE_KEY = "selle"
@@ -28,6 +30,7 @@ def get_ids() -> dict[str, str]:
     return stability_ids(PAGE_KEY)
 
 
+@lru_cache(maxsize=1)
 def create_figure() -> go.Figure:
     """
     Crée le diagramme de phase pour un point selle.
@@ -54,36 +57,39 @@ def get_constraints() -> dict:
     }
 
 
+_LAYOUT_PEDAGOGIC = html.Div(
+    [
+        html.P(
+            "Un point d’équilibre est une selle lorsque les valeurs propres sont réelles et de signes opposés. Une direction est attirante (valeur propre négative) tandis qu’une autre est répulsive (valeur propre positive). Comme il existe au moins une direction instable, le point d’équilibre est toujours instable. Nous pouvons faire une analogie avec le col d'une montagne, on descend d’un côté mais on tombe de l’autre."
+        ),
+        html.H4("Exemple de la vie réelle :"),
+        html.Ul(
+            [
+                html.Li(
+                    "Un col de montagne: Les points cols sont des selles topologiques où vous êtes en bas dans une direction et en haut dans l'autre."
+                ),
+            ]
+        ),
+        html.H4("Caractéristiques mathématiques:"),
+        html.Ul(
+            [
+                html.Li("Deux racines réelles de signes opposés"),
+                html.Li("Une racine positive (divergence)"),
+                html.Li("Une racine négative (convergence)"),
+                html.Li(
+                    "Comportement: instable dans une direction, stable dans l'autre"
+                ),
+            ]
+        ),
+    ]
+)
+
+
 def layout_pedagogic() -> html.Div:
     """
     Retourne le contenu pédagogique pour la page Selle.
     """
-    return html.Div(
-        [
-            html.P(
-                "Un point d’équilibre est une selle lorsque les valeurs propres sont réelles et de signes opposés. Une direction est attirante (valeur propre négative) tandis qu’une autre est répulsive (valeur propre positive). Comme il existe au moins une direction instable, le point d’équilibre est toujours instable. Nous pouvons faire une analogie avec le col d'une montagne, on descend d’un côté mais on tombe de l’autre."
-            ),
-            html.H4("Exemple de la vie réelle :"),
-            html.Ul(
-                [
-                    html.Li(
-                        "Un col de montagne: Les points cols sont des selles topologiques où vous êtes en bas dans une direction et en haut dans l'autre."
-                    ),
-                ]
-            ),
-            html.H4("Caractéristiques mathématiques:"),
-            html.Ul(
-                [
-                    html.Li("Deux racines réelles de signes opposés"),
-                    html.Li("Une racine positive (divergence)"),
-                    html.Li("Une racine négative (convergence)"),
-                    html.Li(
-                        "Comportement: instable dans une direction, stable dans l'autre"
-                    ),
-                ]
-            ),
-        ]
-    )
+    return _LAYOUT_PEDAGOGIC
 
 
 def register_callbacks(app) -> None:
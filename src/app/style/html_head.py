@@ -140,10 +140,37 @@ def get_index_string() -> str:
         } else {
           window.addEventListener('load', typeset);
         }
+        // Ne re-typesetter que les sous-arbres modifiés qui contiennent du
+        // LaTeX : les mises à jour Plotly et la sortie de MathJax elle-même
+        // ne relancent plus un passage sur toute la page.
+        var pending = new Set();
+        function typesetPending() {
+          var roots = Array.from(pending).filter(function(node) {
+            return node.isConnected;
+          });
+          pending.clear();
+          if (roots.length && window.MathJax && MathJax.typesetPromise) {
+            MathJax.typesetPromise(roots);
+          }
+        }
         var appRoot = document.getElementById('_dash-app') || document.body;
-        var observer = new MutationObserver(function() {
-          clearTimeout(observer._mjxTimer);
-          observer._mjxTimer = setTimeout(typeset, 50);
+        var observer = new MutationObserver(function(mutations) {
+          mutations.forEach(function(mutation) {
+            var node = mutation.target;
+            if (node.nodeType !== Node.ELEMENT_NODE) {
+              node = node.parentElement;
+            }
+            if (!node || node.closest('mjx-container, .js-plotly-plot')) {
+              return;
+            }
+            if (node.textContent.indexOf('$') !== -1) {
+              pending.add(node);
+            }
+          });
+          if (pending.size) {
+            clearTimeout(observer._mjxTimer);
+            observer._mjxTimer = setTimeout(typesetPending, 50);
+          }
         });
         observer.observe(appRoot, { childList: true, subtree: true });
       })();
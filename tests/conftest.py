@@ -0,0 +1,8 @@
+"""Configuration pytest: rend le package `src` importable depuis la racine du dépôt."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
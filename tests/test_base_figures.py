@@ -0,0 +1,47 @@
+"""Solution exacte du système linéaire comparée à l'exponentielle de matrice."""
+
+import numpy as np
+import pytest
+from scipy.linalg import expm
+
+from src.app.stabilite.base_figures import _linear_trajectory
+
+T = np.linspace(0.0, 3.0, 31)
+X0 = np.array([1.0, -0.5])
+
+# (a, b, c, d) couvrant les trois branches de _linear_flow
+MATRICES = [
+    pytest.param((1.0, 0.5, 0.5, -2.0), id="selle"),
+    pytest.param((-0.5, 2.0, -2.0, -0.5), id="foyer"),
+    pytest.param((0.0, 1.0, -1.0, 0.0), id="centre"),
+    pytest.param((-1.0, 1.0, 0.0, -1.0), id="noeud-degenere"),
+    pytest.param((0.0, 1.0, 0.0, 0.0), id="mouvement-uniforme"),
+]
+
+
+def _expected(a, b, c, d, x0):
+    """exp(A·t)·x0 pour chaque t de T, en colonnes (x₁, x₂)."""
+    matrix = np.array([[a, b], [c, d]])
+    return np.array([expm(matrix * t) @ x0 for t in T])
+
+
+@pytest.mark.parametrize("coefficients", MATRICES)
+def test_linear_trajectory_matches_expm(coefficients):
+    x1, x2 = _linear_trajectory(*coefficients, X0[0], X0[1], T)
+
+    expected = _expected(*coefficients, X0)
+    np.testing.assert_allclose(x1, expected[:, 0], rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(x2, expected[:, 1], rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("coefficients", MATRICES)
+def test_linear_trajectory_column_seeds(coefficients):
+    seeds = np.array([[1.0, -0.5], [-2.0, 0.3], [0.7, 2.0]])
+
+    x1, x2 = _linear_trajectory(*coefficients, seeds[:, :1], seeds[:, 1:], T)
+
+    assert x1.shape == x2.shape == (len(seeds), len(T))
+    for row, seed in enumerate(seeds):
+        expected = _expected(*coefficients, seed)
+        np.testing.assert_allclose(x1[row], expected[:, 0], rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(x2[row], expected[:, 1], rtol=1e-9, atol=1e-12)
@@ -0,0 +1,99 @@
+"""Classification des équilibres aux frontières du plan de Poincaré."""
+
+import json
+import shutil
+import subprocess
+from itertools import product
+from pathlib import Path
+
+import pytest
+
+from src.app.stabilite.eigenvalue_utils import classify_equilibrium
+
+ASSET = Path(__file__).resolve().parents[1] / "src/app/assets/stabilite.js"
+
+TOL = 1e-10
+
+
+def _reference_classify(tau, delta):
+    """Règles d'origine de classify_equilibrium, comparaisons explicites."""
+    discriminant = tau**2 - 4 * delta
+    if abs(tau) < TOL and abs(delta) < TOL:
+        return "Mouvement uniforme"
+    if abs(tau) < TOL and delta > TOL:
+        return "Centre"
+    if delta < -TOL:
+        return "Point selle (instable)"
+    if abs(delta) < TOL and abs(tau) > TOL:
+        if tau < 0:
+            return "Ligne de points d'équilibre (stable)"
+        return "Ligne de points d'équilibre (instable)"
+    if abs(discriminant) < TOL:
+        return "Nœud dégénéré stable" if tau < 0 else "Nœud dégénéré instable"
+    if discriminant < -TOL:
+        return "Foyer stable" if tau < 0 else "Foyer instable"
+    if discriminant > TOL and delta > TOL:
+        return "Nœud stable" if tau < 0 else "Nœud instable"
+    return "Type indéterminé"
+
+
+# Valeurs nulles, dans la tolérance (1e-11) et juste au-delà (1e-9)
+_NEAR_ZERO = (-1e-9, -1e-11, 0.0, 1e-11, 1e-9)
+_AXIS_POINTS = list(product(_NEAR_ZERO + (-2.0, 2.0), _NEAR_ZERO + (-1.0, 1.0)))
+# Parabole Δ = τ²/4, dessus, dessous, et écarts dans la tolérance
+_PARABOLA_POINTS = [
+    (tau, tau * tau / 4 + offset)
+    for tau, offset in product(
+        (-2.0, -1.0, -0.3, 0.3, 1.0, 2.0), (-1e-9, -1e-12, 0.0, 1e-12, 1e-9)
+    )
+]
+BOUNDARY_POINTS = _AXIS_POINTS + _PARABOLA_POINTS
+
+
+@pytest.mark.parametrize(
+    ("tau", "delta", "expected"),
+    [
+        (0.0, 0.0, "Mouvement uniforme"),
+        (1e-11, -1e-11, "Mouvement uniforme"),
+        (0.0, 1.0, "Centre"),
+        (1e-11, 1.0, "Centre"),
+        (1e-9, 1.0, "Foyer instable"),
+        (-1e-9, 1.0, "Foyer stable"),
+        (0.0, -1.0, "Point selle (instable)"),
+        (-2.0, 0.0, "Ligne de points d'équilibre (stable)"),
+        (2.0, 1e-11, "Ligne de points d'équilibre (instable)"),
+        (-2.0, 1.0, "Nœud dégénéré stable"),
+        (2.0, 1.0 + 1e-12, "Nœud dégénéré instable"),
+        (-2.0, 1.5, "Foyer stable"),
+        (2.0, 0.5, "Nœud instable"),
+        (-2.0, 0.5, "Nœud stable"),
+    ],
+)
+def test_classify_equilibrium_boundaries(tau, delta, expected):
+    assert classify_equilibrium(tau, delta) == expected
+
+
+@pytest.mark.parametrize(("tau", "delta"), BOUNDARY_POINTS)
+def test_classify_equilibrium_matches_reference(tau, delta):
+    assert classify_equilibrium(tau, delta) == _reference_classify(tau, delta)
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node non disponible")
+def test_clientside_classification_matches_python():
+    """classify() de assets/stabilite.js reproduit les mêmes règles."""
+    script = (
+        "global.window = {dash_clientside: {no_update: null}};"
+        f"eval(require('fs').readFileSync({json.dumps(str(ASSET))}, 'utf8'));"
+        "const points = JSON.parse(process.argv[1]);"
+        "const update = window.dash_clientside.stabilite.updateDisplays;"
+        "console.log(JSON.stringify(points.map(([t, d]) => update(t, d)[0])));"
+    )
+    result = subprocess.run(
+        ["node", "-e", script, json.dumps(BOUNDARY_POINTS)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    labels = json.loads(result.stdout)
+    assert labels == [_reference_classify(t, d) for t, d in BOUNDARY_POINTS]